@@ -418,6 +418,19 @@ with Conf('global.cylc', desc='''
                 with some initial options or a command that implements a
                 similar interface to ``ssh``.
             ''')
+            Conf('ssh connection persist', VDR.V_INTERVAL, desc='''
+                If set, remote commands to each host on this platform share
+                a single SSH connection (using the OpenSSH ``ControlMaster``
+                option) rather than connecting afresh for every job submit,
+                poll or kill. The shared connection is closed once it has
+                been idle for this long, and reopened when next needed.
+
+                This requires the ``ssh command`` to be OpenSSH.
+
+                Example::
+
+                   PT5M
+            ''')
             Conf('use login shell', VDR.V_BOOLEAN, True, desc='''
                 Whether to use a login shell or not for remote command
                 invocation. By default cylc runs remote ssh commands using a
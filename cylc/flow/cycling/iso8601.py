@@ -16,6 +16,7 @@
 
 """Date-time cycling by point, interval, and sequence classes."""
 
+from bisect import bisect_left
 from functools import lru_cache
 import re
 
@@ -87,7 +88,11 @@ class ISO8601Point(PointBase):
             return cmp(self.TYPE_SORT_KEY, other.TYPE_SORT_KEY)
         if self.value == other.value:
             return 0
-        return self._iso_point_cmp(self.value, other.value)
+        key = self._iso_point_cmp_key(self.value)
+        other_key = self._iso_point_cmp_key(other.value)
+        if key is None or other_key is None:
+            return self._iso_point_cmp(self.value, other.value)
+        return cmp(key, other_key)
 
     def standardise(self):
         """Reformat self.value into a standard representation."""
@@ -121,6 +126,23 @@ class ISO8601Point(PointBase):
         interval = interval_parse(interval_string)
         return str(point + interval)
 
+    @staticmethod
+    @lru_cache(10000)
+    def _iso_point_cmp_key(point_string):
+        """Return a key to compare the parsed point_string by.
+
+        The key is the (year, month, day, second of day) of the point in UTC,
+        so that comparisons of points are (cached) parses and tuple
+        comparisons of numbers rather than of date-time objects. Return None
+        for truncated points.
+
+        """
+        point = point_parse(point_string)
+        if point.truncated:
+            return None
+        point.set_time_zone_to_utc()
+        return (*point.get_calendar_date(), point.get_second_of_day())
+
     @staticmethod
     @lru_cache(10000)
     def _iso_point_cmp(point_string, other_point_string):
@@ -308,7 +330,8 @@ class ISO8601Sequence(SequenceBase):
     __slots__ = ('dep_section', 'context_start_point', 'context_end_point',
                  'offset', '_cached_first_point_values',
                  '_cached_next_point_values', '_cached_valid_point_booleans',
-                 '_cached_recent_valid_points', 'spec', 'abbrev_util',
+                 '_cached_recent_valid_points', '_cached_window_points',
+                 '_cached_window_keys', 'spec', 'abbrev_util',
                  'recurrence', 'exclusions', 'step', 'value')
 
     @classmethod
@@ -346,6 +369,10 @@ class ISO8601Sequence(SequenceBase):
         self._cached_next_point_values = {}
         self._cached_valid_point_booleans = {}
         self._cached_recent_valid_points = []
+        # Window of consecutive (non-excluded) points of the sequence, with
+        # their comparison keys, slid forward as later points are requested.
+        self._cached_window_points = []
+        self._cached_window_keys = []
 
         self.spec = dep_section
         self.abbrev_util = CylcTimeParser(self.context_start_point,
@@ -405,12 +432,66 @@ class ISO8601Sequence(SequenceBase):
         self._cached_next_point_values = {}
         self._cached_valid_point_booleans = {}
         self._cached_recent_valid_points = []
+        self._cached_window_points = []
+        self._cached_window_keys = []
         self.value = str(self.recurrence) + '!' + str(self.exclusions)
         if self.exclusions:
             self.value += '!' + str(self.exclusions)
 
-    @lru_cache(100)
+    def _window_lookup(self, point):
+        """Return the index of the first window point >= point.
+
+        If the point is beyond the window, slide the window forward (by up to
+        _MAX_CACHED_POINTS points) to the first point > point.
+
+        Returns None if the point is not within the window.
+
+        """
+        keys = self._cached_window_keys
+        if not keys:
+            return None
+        key = ISO8601Point._iso_point_cmp_key(point.value)
+        if key is None or key < keys[0]:
+            return None
+        if key >= keys[-1]:
+            points = self._cached_window_points
+            for _ in range(self._MAX_CACHED_POINTS):
+                next_point = self.get_next_point_on_sequence(points[-1])
+                if next_point is None:
+                    break
+                points.append(next_point)
+                keys.append(ISO8601Point._iso_point_cmp_key(next_point.value))
+                if keys[-1] > key:
+                    break
+            if len(points) > self._MAX_CACHED_POINTS:
+                del points[:-self._MAX_CACHED_POINTS]
+                del keys[:-self._MAX_CACHED_POINTS]
+            if key >= keys[-1]:
+                return None
+        return bisect_left(keys, key)
+
+    def _window_seed(self, point):
+        """Start a new window at an on-sequence point outside the window."""
+        key = ISO8601Point._iso_point_cmp_key(point.value)
+        if key is None:
+            return
+        keys = self._cached_window_keys
+        if not keys or key < keys[0] or key > keys[-1]:
+            self._cached_window_points = [ISO8601Point(point.value)]
+            self._cached_window_keys = [key]
+
     def is_on_sequence(self, point):
+        """Return True if point is on-sequence."""
+        index = self._window_lookup(point)
+        if index is not None:
+            return self._cached_window_points[index] == point
+        is_on_sequence = self._is_on_sequence(point)
+        if is_on_sequence:
+            self._window_seed(point)
+        return is_on_sequence
+
+    @lru_cache(100)
+    def _is_on_sequence(self, point):
         """Return True if point is on-sequence."""
         # Iterate starting at recent valid points, for speed.
         if self.exclusions and point in self.exclusions:
@@ -444,6 +525,13 @@ class ISO8601Sequence(SequenceBase):
 
     def get_prev_point(self, point):
         """Return the previous point < point, or None if out of bounds."""
+        index = self._window_lookup(point)
+        if (
+                index  # (not None or 0)
+                and self._cached_window_points[index] == point
+        ):
+            # (return a copy: points are mutable, e.g. by standardise)
+            return ISO8601Point(self._cached_window_points[index - 1].value)
         # may be None if out of the recurrence bounds
         res = None
         prev_point = self.recurrence.get_prev(point_parse(point.value))
@@ -492,6 +580,12 @@ class ISO8601Sequence(SequenceBase):
 
     def get_next_point(self, point):
         """Return the next point > p, or None if out of bounds."""
+        index = self._window_lookup(point)
+        if index is not None:
+            if self._cached_window_points[index] == point:
+                index += 1
+            # (return a copy: points are mutable, e.g. by standardise)
+            return ISO8601Point(self._cached_window_points[index].value)
         try:
             return ISO8601Point(self._cached_next_point_values[point.value])
         except KeyError:
@@ -541,6 +635,7 @@ class ISO8601Sequence(SequenceBase):
                 self._MAX_CACHED_POINTS):
             self._cached_recent_valid_points.pop(0)
         self._cached_recent_valid_points.append(next_point)
+        self._window_seed(next_point)
 
     def get_next_point_on_sequence(self, point):
         """Return the on-sequence point > point assuming that point is
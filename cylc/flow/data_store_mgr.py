@@ -57,8 +57,11 @@ Packaging methods are included for dissemination of protobuf messages.
 """
 
 from collections import Counter
+from contextlib import contextmanager
 from copy import deepcopy
+from itertools import count
 import json
+from threading import Condition
 from time import time
 import zlib
 
@@ -78,7 +81,7 @@ from cylc.flow.task_state import (
     TASK_STATUS_SUBMIT_FAILED, TASK_STATUS_RUNNING, TASK_STATUS_SUCCEEDED,
     TASK_STATUS_FAILED, TASK_STATUS_EXPIRED)
 from cylc.flow.task_state_prop import extract_group_state
-from cylc.flow.taskdef import generate_graph_parents
+from cylc.flow.taskdef import generate_graph_children, generate_graph_parents
 from cylc.flow.task_state import TASK_STATUSES_FINAL
 from cylc.flow.wallclock import (
     TIME_ZONE_LOCAL_INFO,
@@ -133,6 +136,28 @@ DELTAS_MAP = {
 
 DELTA_FIELDS = {DELTA_ADDED, DELTA_UPDATED, DELTA_PRUNED}
 
+# Data-store element types indexed by state.
+STATE_INDEX_TYPES = (FAMILY_PROXIES, JOBS, TASK_PROXIES)
+
+
+def encode_varint(value):
+    """Return the Protobuf base 128 varint encoding of an unsigned int."""
+    ret = bytearray()
+    while value > 0x7f:
+        ret.append((value & 0x7f) | 0x80)
+        value >>= 7
+    ret.append(value)
+    return bytes(ret)
+
+
+# Protobuf wire format keys (field number, length-delimited wire type) of the
+# delta fields of the AllDeltas message, for assembling it from serialised
+# deltas (see DataStoreMgr.get_publish_deltas).
+ALL_DELTAS_FIELD_KEYS = {
+    field.name: encode_varint(field.number << 3 | 2)
+    for field in AllDeltas.DESCRIPTOR.fields
+}
+
 JOB_STATUSES_ALL = [
     TASK_STATUS_PREPARING,
     TASK_STATUS_SUBMITTED,
@@ -199,10 +224,20 @@ def parse_job_item(item):
     return (point_str, name_str, sub_num)
 
 
-def generate_checksum(in_strings):
-    """Generate cross platform & python checksum from strings."""
+def _string_checksum(in_string):
+    """Generate cross platform & python checksum of a single string."""
     # can't use hash(), it's not the same across 32-64bit or python invocations
-    return zlib.adler32(''.join(sorted(in_strings)).encode()) & 0xffffffff
+    return zlib.crc32(in_string.encode())
+
+
+def generate_checksum(in_strings):
+    """Generate cross platform & python checksum from strings.
+
+    The checksum does not depend on the order of the strings, so it can be
+    maintained incrementally as strings are added and removed (see
+    DataStoreMgr.apply_deltas).
+    """
+    return sum(map(_string_checksum, in_strings)) & 0xffffffff
 
 
 def task_mean_elapsed_time(tdef):
@@ -336,6 +371,70 @@ def create_delta_store(delta=None, workflow_id=None):
     return delta_store
 
 
+class ReadWriteLock:
+    """A lock shared by readers, held exclusively by a writer.
+
+    A waiting writer holds up new readers, so that it is not starved by a
+    stream of them. Neither lock is re-entrant.
+
+    """
+
+    def __init__(self):
+        self._cond = Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        """Hold the lock for reading."""
+        with self._cond:
+            while self._writing or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    def acquire_write(self, blocking=True):
+        """Acquire the lock for writing, return True if acquired.
+
+        If not blocking, do not wait for readers (nor hold them up).
+
+        """
+        with self._cond:
+            if not blocking:
+                if self._writing or self._readers:
+                    return False
+                self._writing = True
+                return True
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+            return True
+
+    def release_write(self):
+        """Release the lock for writing."""
+        with self._cond:
+            self._writing = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        """Hold the lock for writing."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
 class DataStoreMgr:
     """Manage the workflow data store.
 
@@ -359,12 +458,20 @@ class DataStoreMgr:
                 Message containing the global information of the workflow.
         .descendants (dict):
             Local store of config.get_first_parent_descendants()
+        .family_state_totals (dict):
+            Task state totals of each family proxy, {fp_id: Counter}.
+        .family_held_totals (dict):
+            Held task totals of each family proxy, {fp_id: int}.
+        .lock (ReadWriteLock):
+            Held for writing while deltas are applied to the data, and for
+            reading by the server threads while serving requests.
         .n_edge_distance (int):
             Maximum distance of the data-store graph from the active pool.
         .parents (dict):
             Local store of config.get_parent_lists()
         .publish_deltas (list):
-            Collection of the latest applied deltas for publishing.
+            Collection of the latest applied deltas for publishing,
+            serialised as [(topic (bytes), delta (bytes)), ...].
         .schd (cylc.flow.scheduler.Scheduler):
             Workflow scheduler object.
         .workflow_id (str):
@@ -376,6 +483,9 @@ class DataStoreMgr:
     """
 
     ERR_PREFIX_JOBID_MATCH = 'No matching jobs found: '
+    # Max time (seconds) to leave pending deltas unapplied, whilst
+    # requests are being served, before waiting for them.
+    MAX_APPLY_DELAY = 5.0
     ERR_PREFIX_JOB_NOT_ON_SEQUENCE = 'Invalid cycle point for job: '
 
     def __init__(self, schd):
@@ -386,9 +496,21 @@ class DataStoreMgr:
         self.parents = {}
         self.state_update_families = set()
         self.updated_state_families = set()
+        # Family state/held totals, adjusted by the task transitions:
+        # {fp_id: Counter({state: count, ...})}, {fp_id: held_count}
+        self.family_state_totals = {}
+        self.family_held_totals = {}
+        # Task contributions to the family totals:
+        # {tp_id: (state, is_held, (fp_id, ...))}
+        self.family_task_totals = {}
         self.n_edge_distance = 1
         self.next_n_edge_distance = None
         self.xtrigger_tasks = {}
+        # Memoised graph relations of the graph window nodes:
+        # {tp_id: ([children, ...], [parents, ...])}
+        self.graph_relations = {}
+        self.lock = ReadWriteLock()
+        self.apply_deferred_since = None
         # Managed data types
         self.data = {
             self.workflow_id: deepcopy(DATA_TEMPLATE)
@@ -404,6 +526,20 @@ class DataStoreMgr:
             TASK_PROXIES: TPDeltas(),
             WORKFLOW: WDeltas(),
         }
+        # Running (unmasked) checksums of the data-store elements by type,
+        # equivalent to generate_checksum of their stamps (or IDs for edges).
+        self.checksums = {
+            key: 0
+            for key, delta in self.deltas.items()
+            if hasattr(delta, 'checksum')
+        }
+        # Index of the data-store element IDs by state, for filtering:
+        # {element_type: {state: {id: order, ...}}}
+        # The order of an element is its position in the data-store, so that
+        # the index can return elements in the same order as the data-store.
+        self.state_index = {key: {} for key in STATE_INDEX_TYPES}
+        self.state_index_orders = {key: {} for key in STATE_INDEX_TYPES}
+        self.state_index_counter = count()
         self.delta_queues = {self.workflow_id: {}}
         self.publish_deltas = []
         self.all_task_pool = set()
@@ -423,19 +559,23 @@ class DataStoreMgr:
                 Reset data-store before regenerating.
 
         """
-        # Reset attributes/data-store on reload:
-        if reloaded:
-            self.__init__(self.schd)
-
-        # Static elements
-        self.generate_definition_elements()
-
-        # Update workflow statuses and totals (assume needed)
-        self.update_workflow()
+        with self.lock.write():
+            # Reset attributes/data-store on reload:
+            if reloaded:
+                # (keep the lock, it is shared with the server threads)
+                lock = self.lock
+                self.__init__(self.schd)
+                self.lock = lock
+
+            # Static elements
+            self.generate_definition_elements()
+
+            # Update workflow statuses and totals (assume needed)
+            self.update_workflow()
 
-        # Apply current deltas
-        self.apply_deltas(reloaded)
-        self.updates_pending = False
+            # Apply current deltas
+            self.apply_deltas(reloaded)
+            self.updates_pending = False
 
         # Gather this batch of deltas for publish
         self.publish_deltas = self.get_publish_deltas()
@@ -597,6 +737,32 @@ class DataStoreMgr:
             descendant=False, is_parent=False):
         """Generate graph window about given origin to n-edge-distance.
 
+        Args:
+            itask (cylc.flow.task_proxy.TaskProxy):
+                Active/origin task proxy object from the workflow task pool.
+            edge_distance (int):
+                Graph distance from active/origin node.
+            active_id (str):
+                Active/origin node id.
+            descendant (bool):
+                Is the current node a direct descendent of the active/origin.
+            is_parent (bool):
+                Is the current node a parent of the active/origin.
+
+        Returns:
+
+            None
+
+        """
+        self._increment_graph_window(
+            itask.tdef.name, itask.point, itask.flow_label, itask.reflow,
+            edge_distance, active_id, descendant, is_parent, itask)
+
+    def _increment_graph_window(
+            self, name, point, flow_label, reflow, edge_distance, active_id,
+            descendant, is_parent, itask=None):
+        """Generate graph window about given node to n-edge-distance.
+
         Args:
             name (str):
                 Task name.
@@ -604,12 +770,19 @@ class DataStoreMgr:
                 PointBase derived object.
             flow_label (str):
                 Flow label used to distinguish multiple runs.
+            reflow (bool):
+                Reflow of the flow.
             edge_distance (int):
                 Graph distance from active/origin node.
             active_id (str):
                 Active/origin node id.
             descendant (bool):
                 Is the current node a direct descendent of the active/origin.
+            is_parent (bool):
+                Is the current node a parent of the active/origin.
+            itask (cylc.flow.task_proxy.TaskProxy):
+                Task proxy object of the node, if any, otherwise one is
+                only created if the node is not already in the data-store.
 
         Returns:
 
@@ -617,11 +790,8 @@ class DataStoreMgr:
 
         """
         # Create this source node
-        s_node = f'{itask.tdef.name}.{itask.point}'
-        s_id = (
-            f'{self.workflow_id}{ID_DELIM}'
-            f'{itask.point}{ID_DELIM}{itask.tdef.name}'
-        )
+        s_node = f'{name}.{point}'
+        s_id = f'{self.workflow_id}{ID_DELIM}{point}{ID_DELIM}{name}'
         if active_id is None:
             active_id = s_id
 
@@ -644,31 +814,42 @@ class DataStoreMgr:
                 self.n_window_boundary_nodes[
                     active_id].setdefault(edge_distance, set()).add(s_id)
             return
+        children, parents = self._get_graph_relations(
+            s_id, name, point, itask)
         if (
-                (not any(itask.graph_children.values()) and descendant)
+                (not any(children) and descendant)
                 or self.n_edge_distance == 0
         ):
             self.n_window_boundary_nodes[
                 active_id].setdefault(edge_distance, set()).add(s_id)
 
         self.n_window_nodes[active_id].add(s_id)
-        # Generate task proxy node
-        self.generate_ghost_task(s_id, itask, is_parent)
+        # Generate task proxy node (the task proxy object is only needed
+        # for nodes not yet in the data-store).
+        if (
+                s_id not in self.data[self.workflow_id][TASK_PROXIES]
+                and s_id not in self.added[TASK_PROXIES]
+        ):
+            if itask is None:
+                itask = TaskProxy(
+                    self.schd.config.get_taskdef(name), point, flow_label,
+                    submit_num=0, reflow=reflow)
+            self.generate_ghost_task(s_id, itask, is_parent)
 
         edge_distance += 1
 
         # TODO: xtrigger is suite_state edges too
         # Reference set for workflow relations
-        for items in itask.graph_children.values():
+        for items in children:
             if edge_distance == 1:
                 descendant = True
             self._expand_graph_window(
-                s_id, s_node, items, active_id, itask.flow_label, itask.reflow,
+                s_id, s_node, items, active_id, flow_label, reflow,
                 edge_distance, descendant, False)
 
-        for items in generate_graph_parents(itask.tdef, itask.point).values():
+        for items in parents:
             self._expand_graph_window(
-                s_id, s_node, items, active_id, itask.flow_label, itask.reflow,
+                s_id, s_node, items, active_id, flow_label, reflow,
                 edge_distance, False, True)
 
         if edge_distance == 1:
@@ -686,6 +867,35 @@ class DataStoreMgr:
                 getattr(self.updated[WORKFLOW], EDGES).edges.extend(
                     self.n_window_edges[active_id])
 
+    def _get_graph_relations(self, tp_id, name, point, itask=None):
+        """Return the graph children and parents of a task-point node.
+
+        These are memoised by node, until the node is pruned, so the graph
+        window of neighbouring active nodes doesn't regenerate them.
+
+        Returns:
+
+            tuple - (children, parents), lists of the
+            [(name, point, is_abs), ...] relations by output/sequence.
+
+        """
+        try:
+            return self.graph_relations[tp_id]
+        except KeyError:
+            pass
+        if itask is None:
+            tdef = self.schd.config.get_taskdef(name)
+            graph_children = generate_graph_children(tdef, point)
+        else:
+            tdef = itask.tdef
+            graph_children = itask.graph_children
+        relations = (
+            list(graph_children.values()),
+            list(generate_graph_parents(tdef, point).values())
+        )
+        self.graph_relations[tp_id] = relations
+        return relations
+
     def _expand_graph_window(
             self, s_id, s_node, items, active_id, flow_label, reflow,
             edge_distance, descendant=False, is_parent=False):
@@ -723,11 +933,8 @@ class DataStoreMgr:
                 self.n_window_edges[active_id].add(e_id)
             if t_id in self.n_window_nodes[active_id]:
                 continue
-            self.increment_graph_window(
-                TaskProxy(
-                    self.schd.config.get_taskdef(t_name),
-                    t_point, flow_label,
-                    submit_num=0, reflow=reflow),
+            self._increment_graph_window(
+                t_name, t_point, flow_label, reflow,
                 edge_distance, active_id, descendant, is_parent)
 
     def remove_pool_node(self, name, point):
@@ -1063,8 +1270,23 @@ class DataStoreMgr:
             self.update_workflow()
 
         if self.updates_pending:
-            # Apply current deltas
-            self.apply_deltas()
+            # Apply current deltas. While requests are being served, leave
+            # them to a later main loop iteration rather than wait, unless
+            # they have been left for too long.
+            if self.apply_deferred_since is None:
+                self.apply_deferred_since = time()
+            if not self.lock.acquire_write(
+                blocking=(
+                    time() - self.apply_deferred_since
+                    > self.MAX_APPLY_DELAY
+                )
+            ):
+                return
+            try:
+                self.apply_deltas()
+            finally:
+                self.lock.release_write()
+            self.apply_deferred_since = None
             self.updates_pending = False
             # Gather this batch of deltas for publish
             self.publish_deltas = self.get_publish_deltas()
@@ -1119,6 +1341,8 @@ class DataStoreMgr:
                 self.xtrigger_tasks[sig].remove(tp_id)
                 if not self.xtrigger_tasks[sig]:
                     del self.xtrigger_tasks[sig]
+            self._adjust_family_totals(tp_id, None, False, ())
+            self.graph_relations.pop(tp_id, None)
             self.deltas[TASK_PROXIES].pruned.append(tp_id)
             self.deltas[JOBS].pruned.extend(node.jobs)
             self.deltas[EDGES].pruned.extend(node.edges)
@@ -1132,6 +1356,9 @@ class DataStoreMgr:
                 node_ids, parent_ids, checked_ids, prune_ids)
         if prune_ids:
             self.deltas[FAMILY_PROXIES].pruned.extend(prune_ids)
+            for fp_id in prune_ids:
+                self.family_state_totals.pop(fp_id, None)
+                self.family_held_totals.pop(fp_id, None)
         if node_ids:
             self.updates_pending = True
 
@@ -1182,82 +1409,39 @@ class DataStoreMgr:
     def update_family_proxies(self):
         """Update state & summary of flagged families and ancestors.
 
-        Tasks whose state are updated flag their first parent, as a family
-        to be updated, by adding their ID to a set.
-        This set is iterated over here until empty, with each members child
-        families checked/updated and first parent added to the set (flagged).
-        Order doesn't matter, as every family will be checked/updated once at
-        most (as an ancestor will-be/has-been added to the set of updated
-        families).
+        The state and held totals of the families are maintained as
+        counters, adjusted along the ancestry of each task whose state or
+        held status has changed (old -1, new +1), so only the changed tasks
+        are visited. A delta is then created for each family whose totals
+        have changed or that has been flagged for update.
 
         """
         self.updated_state_families.clear()
-        while self.state_update_families:
-            self._family_ascent_point_update(
-                next(iter(self.state_update_families)))
-
-    def _family_ascent_point_update(self, fp_id):
-        """Updates the given family and children recursively.
-
-        First the child families that haven't been checked/updated are acted
-        on first by calling this function. This recursion ends at the family
-        first called with this function, which then adds it's first parent
-        ancestor to the set of families flagged for update.
+        tp_data = self.data[self.workflow_id][TASK_PROXIES]
+        tp_added = self.added[TASK_PROXIES]
+        tp_updated = self.updated[TASK_PROXIES]
+        for tp_id in set(tp_added).union(tp_updated):
+            tp_node = tp_added.get(tp_id, tp_data.get(tp_id))
+            if tp_node is None:
+                continue
+            tp_delta = tp_updated.get(tp_id)
+            tp_state = tp_delta
+            if tp_state is None or not tp_state.HasField('state'):
+                tp_state = tp_node
+            tp_held = tp_delta
+            if tp_held is None or not tp_held.HasField('is_held'):
+                tp_held = tp_node
+            self._adjust_family_totals(
+                tp_id, tp_state.state, tp_held.is_held, tp_node.ancestors)
 
-        """
-        fp_added = self.added[FAMILY_PROXIES]
         fp_data = self.data[self.workflow_id][FAMILY_PROXIES]
-        if fp_id in fp_data:
-            fam_node = fp_data[fp_id]
-        elif fp_id in fp_added:
-            fam_node = fp_added[fp_id]
-        else:
-            # TODO: Shouldn't need with event driven updates
-            # as nodes will be updated before removal.
-            if fp_id in self.state_update_families:
-                self.updated_state_families.add(fp_id)
-                self.state_update_families.remove(fp_id)
-            return
-        # Gather child families, then check/update recursively
-        child_fam_nodes = [
-            n_id
-            for n_id in fam_node.child_families
-            if n_id not in self.updated_state_families
-        ]
-        for child_fam_id in child_fam_nodes:
-            self._family_ascent_point_update(child_fam_id)
-        if fp_id in self.state_update_families:
-            fp_updated = self.updated[FAMILY_PROXIES]
-            tp_data = self.data[self.workflow_id][TASK_PROXIES]
-            tp_updated = self.updated[TASK_PROXIES]
-            tp_added = self.added[TASK_PROXIES]
-            # gather child family states for count and set is_held
-            state_counter = Counter({})
-            is_held_total = 0
-            for child_id in fam_node.child_families:
-                child_node = fp_updated.get(child_id, fp_data.get(child_id))
-                if child_node is not None:
-                    is_held_total += child_node.is_held_total
-                    state_counter += Counter(dict(child_node.state_totals))
-            # Gather all child task states
-            task_states = []
-            for tp_id in fam_node.child_tasks:
-                tp_delta = tp_updated.get(tp_id)
-                tp_node = tp_added.get(tp_id, tp_data.get(tp_id))
-
-                tp_state = tp_delta
-                if tp_state is None or not tp_state.HasField('state'):
-                    tp_state = tp_node
-                if tp_state.state:
-                    task_states.append(tp_state.state)
-
-                tp_held = tp_delta
-                if tp_held is None or not tp_held.HasField('is_held'):
-                    tp_held = tp_node
-                if tp_held.is_held:
-                    is_held_total += 1
-
-            state_counter += Counter(task_states)
+        fp_added = self.added[FAMILY_PROXIES]
+        fp_updated = self.updated[FAMILY_PROXIES]
+        for fp_id in self.state_update_families:
+            if fp_id not in fp_data and fp_id not in fp_added:
+                continue
+            state_counter = self.family_state_totals.get(fp_id, Counter())
+            is_held_total = self.family_held_totals.get(fp_id, 0)
             # created delta data element
             fp_delta = PbFamilyProxy(
                 id=fp_id,
@@ -1270,12 +1454,49 @@ class DataStoreMgr:
             for state, state_cnt in state_counter.items():
                 fp_delta.state_totals[state] = state_cnt
             fp_updated.setdefault(fp_id, PbFamilyProxy()).MergeFrom(fp_delta)
-            # mark as updated in case parent family is updated next
             self.updated_state_families.add(fp_id)
-            # mark parent for update
-            if fam_node.first_parent:
-                self.state_update_families.add(fam_node.first_parent)
-            self.state_update_families.remove(fp_id)
+        self.state_update_families.clear()
+
+    def _adjust_family_totals(self, tp_id, state, is_held, ancestors):
+        """Move a task's contribution to its ancestor family totals.
+
+        Subtract the previously counted state and held status of the task
+        from the family totals and add the new ones, flagging the families
+        for update if changed. Remove the task if state is None.
+
+        """
+        old = self.family_task_totals.get(tp_id)
+        if state is None:
+            if old is None:
+                return
+            del self.family_task_totals[tp_id]
+            new = None
+        else:
+            new = (state, is_held, tuple(ancestors))
+            if new == old:
+                return
+            self.family_task_totals[tp_id] = new
+        if old is not None:
+            old_state, old_held, old_ancestors = old
+            for fp_id in old_ancestors:
+                # The family totals may have been pruned already.
+                state_counter = self.family_state_totals.get(fp_id)
+                if old_state and state_counter:
+                    state_counter[old_state] -= 1
+                    if state_counter[old_state] <= 0:
+                        del state_counter[old_state]
+                if old_held and self.family_held_totals.get(fp_id):
+                    self.family_held_totals[fp_id] -= 1
+            self.state_update_families.update(old_ancestors)
+        if new is not None:
+            for fp_id in ancestors:
+                if state:
+                    self.family_state_totals.setdefault(
+                        fp_id, Counter())[state] += 1
+                if is_held:
+                    self.family_held_totals[fp_id] = (
+                        self.family_held_totals.get(fp_id, 0) + 1)
+            self.state_update_families.update(ancestors)
 
     def set_graph_window_extent(self, n_edge_distance):
         """Set what the max edge distance will change to.
@@ -1671,7 +1892,11 @@ class DataStoreMgr:
         return (node_id, False)
 
     def apply_deltas(self, reloaded=False):
-        """Gather and apply deltas."""
+        """Gather and apply deltas.
+
+        The caller should hold self.lock for writing.
+
+        """
         # Gather cumulative update element
         for key, elements in self.added.items():
             if elements:
@@ -1688,27 +1913,82 @@ class DataStoreMgr:
                     continue
                 self.deltas[key].updated.extend(elements.values())
 
-        # Apply deltas to local data-store
+        # Apply deltas to local data-store, maintaining the checksums of the
+        # element types by removing the changed elements before application
+        # and adding them back after.
         data = self.data[self.workflow_id]
         for key, delta in self.deltas.items():
             if delta.ListFields():
                 delta.reloaded = reloaded
-                apply_delta(key, delta, data)
+                if key in self.checksums:
+                    # (dict keys keep the order in which they are added)
+                    e_ids = dict.fromkeys(e.id for e in delta.added)
+                    e_ids.update(dict.fromkeys(e.id for e in delta.updated))
+                    e_ids.update(dict.fromkeys(delta.pruned))
+                    self._adjust_indexes(key, data[key], e_ids, -1)
+                    apply_delta(key, delta, data)
+                    self._adjust_indexes(key, data[key], e_ids, 1)
+                else:
+                    apply_delta(key, delta, data)
 
-        # Construct checksum on deltas for export
+        # Set checksum on deltas for export
         update_time = time()
         for key, delta in self.deltas.items():
             if delta.ListFields():
                 delta.time = update_time
-                if hasattr(delta, 'checksum'):
-                    if key == EDGES:
-                        s_att = 'id'
-                    else:
-                        s_att = 'stamp'
-                    delta.checksum = generate_checksum(
-                        [getattr(e, s_att)
-                         for e in data[key].values()]
-                    )
+                if key in self.checksums:
+                    delta.checksum = self.checksums[key] & 0xffffffff
+
+    def _adjust_indexes(self, key, elements, e_ids, sign):
+        """Add (sign=1) or remove (sign=-1) elements from the type indexes."""
+        s_att = 'id' if key == EDGES else 'stamp'
+        state_index = self.state_index.get(key)
+        orders = self.state_index_orders.get(key)
+        for e_id in e_ids:
+            try:
+                element = elements[e_id]
+            except KeyError:
+                if orders is not None and sign > 0:
+                    # pruned
+                    orders.pop(e_id, None)
+                continue
+            self.checksums[key] += sign * _string_checksum(
+                getattr(element, s_att))
+            if state_index is None:
+                continue
+            if sign > 0:
+                if e_id not in orders:
+                    orders[e_id] = next(self.state_index_counter)
+                state_index.setdefault(element.state, {})[e_id] = orders[e_id]
+            elif element.state in state_index:
+                state_index[element.state].pop(e_id, None)
+
+    def get_nodes_by_states(self, element_type, states):
+        """Return the data-store elements of a type in any of the states.
+
+        Args:
+            element_type (str):
+                Key from STATE_INDEX_TYPES.
+            states (iterable):
+                State names.
+
+        Returns:
+            list - In data-store order.
+
+        """
+        elements = self.data[self.workflow_id][element_type]
+        state_index = self.state_index[element_type]
+        e_ids = []
+        for state in set(states):
+            # (copy, the data-store may be updated by another thread)
+            e_ids.extend(list(state_index.get(state, {}).items()))
+        e_ids.sort(key=lambda item: item[1])
+        nodes = []
+        for e_id, _ in e_ids:
+            node = elements.get(e_id)
+            if node is not None:
+                nodes.append(node)
+        return nodes
 
     def clear_deltas(self):
         """Clear current deltas."""
@@ -1744,18 +2024,26 @@ class DataStoreMgr:
         return workflow_msg
 
     def get_publish_deltas(self):
-        """Return deltas for publishing."""
-        all_deltas = DELTAS_MAP[ALL_DELTAS]()
+        """Return serialised deltas for publishing.
+
+        Each delta is serialised once. The all-deltas message is assembled
+        from the same bytes, as an embedded message field is just its key and
+        length followed by the serialised message.
+
+        """
+        all_deltas = []
         result = []
         for key, delta in self.deltas.items():
             if delta.ListFields():
-                result.append(
-                    (key.encode('utf-8'), delta, 'SerializeToString'))
-                getattr(all_deltas, key).CopyFrom(delta)
-        result.append(
-            (ALL_DELTAS.encode('utf-8'), all_deltas, 'SerializeToString')
-        )
-        return deepcopy(result)
+                delta_bytes = delta.SerializeToString()
+                result.append((key.encode('utf-8'), delta_bytes))
+                all_deltas.extend((
+                    ALL_DELTAS_FIELD_KEYS[key],
+                    encode_varint(len(delta_bytes)),
+                    delta_bytes
+                ))
+        result.append((ALL_DELTAS.encode('utf-8'), b''.join(all_deltas)))
+        return result
 
     def get_data_elements(self, element_type):
         """Get elements of a given type in the form of a delta.
@@ -15,6 +15,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Write task job files."""
 
+from hashlib import sha256
+from io import StringIO
 import os
 import re
 import stat
@@ -37,6 +39,9 @@ class JobFileWriter:
     def __init__(self):
         self.suite_env = {}
         self.job_runner_mgr = JobRunnerManager()
+        # Digests of the user defined job script text which has already
+        # passed the syntax check.
+        self.syntax_checked = set()
 
     def set_suite_env(self, suite_env):
         """Configure suite environment for all job files."""
@@ -62,17 +67,35 @@ class JobFileWriter:
         try:
             with open(tmp_name, 'w') as handle:
                 self._write_header(handle, job_conf)
+                # Other than the header, the job runner generated directives
+                # (job name, job log paths) and the task IDs of the task
+                # environment, the job script is the same for jobs of the
+                # same user defined text (directive values, paths,
+                # environment, scripts), so the syntax check is only
+                # repeated when this changes.
                 self._write_directives(handle, job_conf)
-                self._write_reinvocation(handle)
-                self._write_prelude(handle, job_conf)
-                self._write_suite_environment(handle, job_conf, run_d)
+                digest = sha256(repr(list(
+                    (job_conf.get('directives') or {}).items())).encode())
+                user_handle = StringIO()
+                self._write_reinvocation(user_handle)
+                self._write_prelude(user_handle, job_conf)
+                self._write_suite_environment(user_handle, job_conf, run_d)
+                handle.write(user_handle.getvalue())
+                digest.update(user_handle.getvalue().encode())
                 self._write_task_environment(handle, job_conf)
-                self._write_global_init_script(handle, job_conf)
+                digest.update(repr((
+                    job_conf['work_d'],
+                    sorted(job_conf['param_var'].items()),
+                )).encode())
+                user_handle = StringIO()
+                self._write_global_init_script(user_handle, job_conf)
                 # suite bin access must be before runtime environment
                 # because suite bin commands may be used in variable
                 # assignment expressions: FOO=$(command args).
-                self._write_runtime_environment(handle, job_conf)
-                self._write_script(handle, job_conf)
+                self._write_runtime_environment(user_handle, job_conf)
+                self._write_script(user_handle, job_conf)
+                handle.write(user_handle.getvalue())
+                digest.update(user_handle.getvalue().encode())
                 self._write_epilogue(handle, job_conf, run_d)
         except IOError as exc:
             # Remove temporary file
@@ -81,8 +104,9 @@ class JobFileWriter:
             except OSError:
                 pass
             raise exc
-        # check syntax
-        if check_syntax:
+        # check syntax, once for each distinct user defined text
+        syntax_key = digest.digest()
+        if check_syntax and syntax_key not in self.syntax_checked:
             try:
                 with Popen(
                         ['/usr/bin/env', 'bash', '-n', tmp_name],
@@ -102,6 +126,7 @@ class JobFileWriter:
                 except OSError:
                     pass
                 raise exc
+            self.syntax_checked.add(syntax_key)
         # Make job file executable
         mode = (
             os.stat(tmp_name).st_mode |
@@ -41,6 +41,19 @@ class BgCommandHandler:
     POLL_CMD = "ps"
     REC_ID_FROM_SUBMIT_OUT = re.compile(r"""\A(?P<id>\d+)\Z""")
 
+    @classmethod
+    def submit_many(cls, jobs):
+        """Submit "jobs", a list of (job_file_path, submit_opts), in turn.
+
+        Background submissions only start a process, so submit them one
+        after another in this thread rather than in the job runner
+        manager's thread pool.
+
+        """
+        return [
+            cls.submit(job_file_path, submit_opts)
+            for job_file_path, submit_opts in jobs]
+
     @classmethod
     def submit(cls, job_file_path, submit_opts):
         """Submit "job_file_path"."""
@@ -63,8 +76,10 @@ class BgCommandHandler:
                 timeout_str = (
                     " timeout --signal=XCPU %d" % execution_time_limit)
             # This is essentially a double fork to ensure that the child
-            # process can detach as a process group leader and not subjected to
-            # SIGHUP from the current process.
+            # process can detach as a session (and process group) leader and
+            # not subjected to SIGHUP from the current process.
+            # (start_new_session rather than preexec_fn=os.setpgrp, which is
+            # not safe to use in the presence of threads.)
             # TODO: close stdout? Maybe atexit?
             proc = Popen(
                 [
@@ -76,7 +91,7 @@ class BgCommandHandler:
                     job_file_path,
                 ],
                 env=submit_opts.get('env'),
-                preexec_fn=os.setpgrp,
+                start_new_session=True,
                 stdin=DEVNULL,
                 stdout=open(os.devnull, "wb"),
                 stderr=STDOUT)
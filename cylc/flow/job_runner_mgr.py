@@ -63,6 +63,15 @@ job_runner.submit(job_file_path, submit_opts) => ret_code, out, err
       "job_runner.SUBMIT_CMD". You must pass "env=submit_opts.get('env')" to
       Popen - see background.py for example.
 
+job_runner.submit_many(jobs) => [(ret_code, out, err), ...]
+    * Submit multiple jobs in bulk (e.g. as a job array), where "jobs" is a
+      list of (job_file_path, submit_opts) and the return value is a list of
+      the results for each job, in the same order. If defined, this is used
+      instead of "job_runner.submit" and "job_runner.SUBMIT_CMD_TMPL" to
+      submit the jobs of a "jobs_submit" call. Otherwise, jobs are submitted
+      concurrently by a pool of threads. Job IDs are extracted from the
+      output of each job as for "job_runner.submit".
+
 job_runner.manip_job_id(job_id) => job_id
     * Modify the job ID that is returned by the job submit command.
 
@@ -113,6 +122,7 @@ job_runner.SUBMIT_CMD_TMPL
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import shlex
@@ -207,6 +217,8 @@ class JobRunnerManager():
     OUT_PREFIX_MESSAGE = "[TASK JOB MESSAGE]"
     OUT_PREFIX_SUMMARY = "[TASK JOB SUMMARY]"
     OUT_PREFIX_CMD_ERR = "[TASK JOB ERROR]"
+    # Maximum number of concurrent job submit commands.
+    SUBMIT_MAX_WORKERS = 4
     _INSTANCES = {}
 
     @classmethod
@@ -366,15 +378,26 @@ class JobRunnerManager():
         else:
             items = self._jobs_submit_prep_by_args(job_log_root, job_log_dirs)
         now = get_current_time_string(override_use_utc=utc_mode)
+        jobs = []
+        # [(job_log_dir, index in jobs or None), ...] in input order
+        job_indexes = []
         for job_log_dir, job_runner_name, submit_opts in items:
+            if not job_runner_name:
+                job_indexes.append((job_log_dir, None))
+                continue
             job_file_path = os.path.join(
                 job_log_root, job_log_dir, JOB_LOG_JOB)
-            if not job_runner_name:
+            job_indexes.append((job_log_dir, len(jobs)))
+            jobs.append(
+                (job_log_dir, job_file_path, job_runner_name, submit_opts))
+        results = self._jobs_submit_impl(jobs)
+        # Report in input order, whatever the order of submission.
+        for job_log_dir, index in job_indexes:
+            if index is None:
                 sys.stdout.write("%s%s|%s|1|\n" % (
                     self.OUT_PREFIX_SUMMARY, now, job_log_dir))
                 continue
-            ret_code, out, err, job_id = self._job_submit_impl(
-                job_file_path, job_runner_name, submit_opts)
+            ret_code, out, err, job_id = results[index]
             sys.stdout.write("%s%s|%s|%d|%s\n" % (
                 self.OUT_PREFIX_SUMMARY, now, job_log_dir, ret_code, job_id))
             for key, value in [("STDERR", err), ("STDOUT", out)]:
@@ -539,14 +562,16 @@ class JobRunnerManager():
 
     def _jobs_poll_runner(self, job_log_root, job_runner_name, my_ctx_list):
         """Helper 2 for self.jobs_poll(job_log_root, job_log_dirs)."""
+        # Job IDs/PIDs are kept in sets so that matching them against the
+        # poll command output is linear in the number of jobs.
         exp_job_ids = [ctx.job_id for ctx in my_ctx_list]
-        bad_job_ids = list(exp_job_ids)
+        bad_job_ids = set(exp_job_ids)
         exp_pids = []
-        bad_pids = []
+        bad_pids = set()
         items = [[self._get_sys(job_runner_name), exp_job_ids, bad_job_ids]]
         if getattr(items[0][0], "SHOULD_POLL_PROC_GROUP", False):
             exp_pids = [ctx.pid for ctx in my_ctx_list if ctx.pid is not None]
-            bad_pids.extend(exp_pids)
+            bad_pids.update(exp_pids)
             items.append([self._get_sys("background"), exp_pids, bad_pids])
         debug_messages = []
         for job_runner, exp_ids, bad_ids in items:
@@ -566,8 +591,10 @@ class JobRunnerManager():
                     exc.filename = cmd[0]
                 sys.stderr.write(f"{exc}\n")
                 return
-            ret_code = proc.wait()
+            # Read the output before waiting for the command to exit, else a
+            # large poll output would fill the pipe and block the command.
             out, err = (f.decode() for f in proc.communicate())
+            ret_code = proc.wait()
             debug_messages.append('{0} - {1}'.format(
                 job_runner, len(out.split('\n')))
             )
@@ -576,14 +603,11 @@ class JobRunnerManager():
                     job_runner.POLL_CANT_CONNECT_ERR in err):
                 # Poll command failed because it cannot connect to job runner
                 # Assume jobs are still healthy until the job runner is back.
-                bad_ids[:] = []
+                bad_ids.clear()
             elif hasattr(job_runner, "filter_poll_many_output"):
                 # Allow custom filter
-                for id_ in job_runner.filter_poll_many_output(out):
-                    try:
-                        bad_ids.remove(id_)
-                    except ValueError:
-                        pass
+                bad_ids.difference_update(
+                    job_runner.filter_poll_many_output(out))
             else:
                 # Just about all poll commands return a table, with column 1
                 # being the job ID. The logic here should be sufficient to
@@ -593,19 +617,16 @@ class JobRunnerManager():
                         head = line.split(None, 1)[0]
                     except IndexError:
                         continue
-                    if head in exp_ids:
-                        try:
-                            bad_ids.remove(head)
-                        except ValueError:
-                            pass
+                    bad_ids.discard(head)
 
+        exp_pid_set = set(exp_pids)
         debug_flag = False
         for ctx in my_ctx_list:
             ctx.job_runner_exit_polled = int(
                 ctx.job_id in bad_job_ids)
             # Exited job runner, but process still running
             # This can happen to jobs in some "at" implementation
-            if ctx.job_runner_exit_polled and ctx.pid in exp_pids:
+            if ctx.job_runner_exit_polled and ctx.pid in exp_pid_set:
                 if ctx.pid not in bad_pids:
                     ctx.job_runner_exit_polled = 0
                 else:
@@ -625,39 +646,59 @@ class JobRunnerManager():
         if debug_flag:
             ctx.job_runner_call_no_lines = ', '.join(debug_messages)
 
+    def _jobs_submit_impl(self, jobs):
+        """Helper for self.jobs_submit().
+
+        Submit the jobs in bulk with "job_runner.submit_many" where the job
+        runner supports it, else concurrently.
+
+        jobs -- A list of
+                (job_log_dir, job_file_path, job_runner_name, submit_opts).
+
+        Return a list of (ret_code, out, err, job_id) for the jobs, in order.
+
+        """
+        results = [None] * len(jobs)
+        indexes_by_job_runner = {}
+        for index, (_, _, job_runner_name, _) in enumerate(jobs):
+            indexes_by_job_runner.setdefault(job_runner_name, []).append(index)
+        other_indexes = []
+        for job_runner_name, indexes in indexes_by_job_runner.items():
+            job_runner = self._get_sys(job_runner_name)
+            if not hasattr(job_runner, "submit_many"):
+                other_indexes.extend(indexes)
+                continue
+            env = self._job_submit_env(job_runner)
+            bulk_jobs = []
+            for index in indexes:
+                _, job_file_path, _, submit_opts = jobs[index]
+                self._job_submit_prep(job_file_path, job_runner_name)
+                submit_opts['env'] = env
+                bulk_jobs.append((job_file_path, submit_opts))
+            # job_runner.submit_many should handle OSError, if relevant.
+            for index, (ret_code, out, err) in zip(
+                    indexes, job_runner.submit_many(bulk_jobs)):
+                results[index] = self._job_submit_post(
+                    jobs[index][1], job_runner, ret_code, out, err)
+        if len(other_indexes) == 1:
+            index = other_indexes[0]
+            results[index] = self._job_submit_impl(*jobs[index][1:])
+        elif other_indexes:
+            with ThreadPoolExecutor(self.SUBMIT_MAX_WORKERS) as executor:
+                for index, result in zip(other_indexes, executor.map(
+                        lambda index: self._job_submit_impl(*jobs[index][1:]),
+                        other_indexes)):
+                    results[index] = result
+        return results
+
     def _job_submit_impl(
             self, job_file_path, job_runner_name, submit_opts):
         """Helper for self.jobs_submit() and self.job_submit()."""
-
-        # Create NN symbolic link, if necessary
-        self._create_nn(job_file_path)
-        for name in JOB_LOG_ERR, JOB_LOG_OUT:
-            try:
-                os.unlink(os.path.join(job_file_path, name))
-            except OSError:
-                pass
-
-        # Start new status file
-        job_status_file = open(f"{job_file_path}.status", "w")
-        job_status_file.write(
-            "{0}={1}\n".format(self.CYLC_JOB_RUNNER_NAME, job_runner_name))
-        job_status_file.close()
+        self._job_submit_prep(job_file_path, job_runner_name)
 
         # Submit job
         job_runner = self._get_sys(job_runner_name)
-        if not self.clean_env:
-            # Pass the whole environment to the job submit subprocess.
-            # (Note this runs on the job host).
-            env = os.environ
-        else:
-            # $HOME is required by job.sh on the job host.
-            env = {'HOME': os.environ.get('HOME', '')}
-        # Pass selected extra variables to the job submit subprocess.
-        for var in self.env:
-            env[var] = os.environ.get(var, '')
-        if self.path is not None:
-            # Append to avoid overriding an inherited PATH (e.g. in a venv)
-            env['PATH'] = env.get('PATH', '') + ':' + ':'.join(self.path)
+        env = self._job_submit_env(job_runner)
         if hasattr(job_runner, "submit"):
             submit_opts['env'] = env
             # job_runner.submit should handle OSError, if relevant.
@@ -704,6 +745,45 @@ class JobRunnerManager():
             except (AttributeError, IOError):
                 pass
 
+        return self._job_submit_post(
+            job_file_path, job_runner, ret_code, out, err)
+
+    def _job_submit_prep(self, job_file_path, job_runner_name):
+        """Prepare the job log directory and status file for a submit."""
+        # Create NN symbolic link, if necessary
+        self._create_nn(job_file_path)
+        for name in JOB_LOG_ERR, JOB_LOG_OUT:
+            try:
+                os.unlink(os.path.join(job_file_path, name))
+            except OSError:
+                pass
+
+        # Start new status file
+        job_status_file = open(f"{job_file_path}.status", "w")
+        job_status_file.write(
+            "{0}={1}\n".format(self.CYLC_JOB_RUNNER_NAME, job_runner_name))
+        job_status_file.close()
+
+    def _job_submit_env(self, job_runner):
+        """Return the environment for the job submit subprocess."""
+        if not self.clean_env:
+            # Pass the whole environment to the job submit subprocess.
+            # (Note this runs on the job host).
+            # (Copy, as jobs may be submitted concurrently.)
+            env = dict(os.environ)
+        else:
+            # $HOME is required by job.sh on the job host.
+            env = {'HOME': os.environ.get('HOME', '')}
+        # Pass selected extra variables to the job submit subprocess.
+        for var in self.env:
+            env[var] = os.environ.get(var, '')
+        if self.path is not None:
+            # Append to avoid overriding an inherited PATH (e.g. in a venv)
+            env['PATH'] = env.get('PATH', '') + ':' + ':'.join(self.path)
+        return env
+
+    def _job_submit_post(self, job_file_path, job_runner, ret_code, out, err):
+        """Return (ret_code, out, err, job_id) of a job submit command."""
         # Filter submit command output, if relevant
         # Get job ID, if possible
         job_id = None
@@ -19,7 +19,7 @@ GraphQL Middleware defined here also.
 
 """
 
-from functools import partial
+from functools import lru_cache, partial
 import logging
 
 from inspect import isclass, iscoroutinefunction
@@ -33,8 +33,10 @@ from graphql.language.base import parse, print_ast
 from graphql.language import ast
 from graphql.backend.base import GraphQLBackend, GraphQLDocument
 from graphql.backend.core import execute_and_validate
+from graphql.execution import ExecutionResult
 from graphql.utils.base import type_from_ast
 from graphql.type import get_named_type
+from graphql.validation import validate
 from promise import Promise
 from rx import Observable
 
@@ -246,10 +248,29 @@ class AstDocArguments:
         return False
 
 
+@lru_cache(maxsize=100)
+def parse_and_validate(schema, document_string):
+    """Parse and validate a request document, cache the result.
+
+    Clients tend to send the same few requests over and over.
+
+    Args:
+        schema (GraphQLSchema)
+        document_string (str)
+
+    Returns
+        tuple - (document_ast, validation_errors)
+
+    """
+    document_ast = parse(document_string)
+    return document_ast, validate(schema, document_ast)
+
+
 def execute_and_validate_and_strip(
         schema,
         document_ast,
         *args,
+        validation_errors=None,
         **kwargs
 ):
     """
@@ -257,12 +278,18 @@ def execute_and_validate_and_strip(
         schema (GraphQLSchema)
         document_ast (Document)
         args (Any)
+        validation_errors (list, optional):
+            Result of validating document_ast, if already done.
         kwargs (Any)
 
     Returns
         Union[ExecutionResult, Observable]
 
     """
+    if validation_errors is not None and kwargs.get('validate', True):
+        if validation_errors:
+            return ExecutionResult(errors=validation_errors, invalid=True)
+        kwargs['validate'] = False
     result = execute_and_validate(schema, document_ast, *args, **kwargs)
 
     # Search request document to determine if 'stripNull: true' is set
@@ -312,12 +339,15 @@ class CylcGraphQLBackend(GraphQLBackend):
             graphql.GraphQLDocument
 
         """
+        validation_errors = None
         if isinstance(document_string, ast.Document):
             document_ast = document_string
             document_string = print_ast(document_ast)
+        elif isinstance(document_string, str):
+            document_ast, validation_errors = parse_and_validate(
+                schema, document_string)
         else:
-            if not isinstance(document_string, str):
-                logger.error("The query must be a string")
+            logger.error("The query must be a string")
             document_ast = parse(document_string)
         return GraphQLDocument(
             schema=schema,
@@ -327,6 +357,7 @@ class CylcGraphQLBackend(GraphQLBackend):
                 execute_and_validate_and_strip,
                 schema,
                 document_ast,
+                validation_errors=validation_errors,
                 **self.execute_params
             ),
         )
@@ -85,8 +85,9 @@ class WorkflowPublisher(ZMQSocketBase):
             # don't attempt to send anything if we are in the process of
             # shutting down
             self.topics.add(topic)
+            # (zero-copy send, the serialised data must not be modified)
             self.socket.send_multipart(
-                [topic, serialize_data(data, serializer)]
+                [topic, serialize_data(data, serializer)], copy=False
             )
 
     async def publish(self, items):
@@ -94,6 +95,7 @@ class WorkflowPublisher(ZMQSocketBase):
 
         Args:
             items (iterable): [(topic, data, serializer)]
+                The serializer may be omitted if data is bytes.
 
         """
         try:
@@ -28,7 +28,7 @@ from graphene.utils.str_converters import to_snake_case
 from cylc.flow import ID_DELIM
 from cylc.flow.data_store_mgr import (
     EDGES, FAMILY_PROXIES, TASK_PROXIES, WORKFLOW,
-    DELTA_ADDED, create_delta_store
+    DELTA_ADDED, STATE_INDEX_TYPES, create_delta_store
 )
 from cylc.flow.network.schema import (
     NodesEdges, PROXY_NODES, SUB_RESOLVERS, parse_node_id, sort_elements
@@ -225,10 +225,28 @@ class BaseResolvers:
         return sort_elements(
             [n
              for flow in await self.get_workflows_data(args)
-             for n in flow.get(node_type).values()
+             for n in self.get_filter_candidates(flow, node_type, args)
              if node_filter(n, node_type, args)],
             args)
 
+    def get_filter_candidates(self, flow, node_type, args):
+        """Return the nodes of a workflow that may match the filter args.
+
+        Use the data-store state index if filtering the data-store of this
+        workflow by state (other workflows, e.g. those of a UI Server, and
+        subscription delta stores are scanned).
+        """
+        if (
+            args.get('states')
+            and node_type in STATE_INDEX_TYPES
+            and hasattr(self.data_store_mgr, 'state_index')
+            and flow is self.data_store_mgr.data.get(
+                self.data_store_mgr.workflow_id)
+        ):
+            return self.data_store_mgr.get_nodes_by_states(
+                node_type, args['states'])
+        return flow.get(node_type).values()
+
     async def get_nodes_by_ids(self, node_type, args):
         """Return protobuf node objects for given id."""
         nat_ids = set(args.get('native_ids', []))
@@ -15,19 +15,24 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Server for suite runtime API."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import getpass  # noqa: F401
-from queue import Queue
+from queue import Empty, Queue
 from textwrap import dedent
 from time import sleep
 
+from graphql.error import GraphQLError
 from graphql.execution.executors.asyncio import AsyncioExecutor
+from graphql.language import ast
 import zmq
 
 from cylc.flow import LOG
 from cylc.flow.network import encode_, decode_, ZMQSocketBase
 from cylc.flow.network.authorisation import authorise
 from cylc.flow.network.graphql import (
-    CylcGraphQLBackend, IgnoreFieldMiddleware, instantiate_middleware
+    CylcGraphQLBackend, IgnoreFieldMiddleware, instantiate_middleware,
+    parse_and_validate
 )
 from cylc.flow.network.resolvers import Resolvers
 from cylc.flow.network.schema import schema
@@ -66,6 +71,11 @@ def filter_none(dictionary):
     }
 
 
+def _set_event_loop():
+    """Give a worker thread its own event loop (for the GraphQL executor)."""
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+
 class SuiteRuntimeServer(ZMQSocketBase):
     """Suite runtime service API facade exposed via zmq.
 
@@ -125,15 +135,28 @@ class SuiteRuntimeServer(ZMQSocketBase):
 
     """
 
+    BUSY_POLL_TIMEOUT = 0.01
+    """Max time the SuiteRuntimeServer will wait for an incoming message in
+    seconds, whilst requests are being served by the workers.
+
+    The listener must get back to sending their responses promptly.
+
+    """
+
+    MAX_WORKERS = 4
+    """Number of threads serving requests concurrently."""
+
     def __init__(self, schd, context=None, barrier=None,
                  threaded=True, daemon=False):
-        super().__init__(zmq.REP, bind=True, context=context,
+        super().__init__(zmq.ROUTER, bind=True, context=context,
                          barrier=barrier, threaded=threaded, daemon=daemon)
         self.schd = schd
         self.suite = schd.suite
         self.public_priv = None  # update in get_public_priv()
         self.endpoints = None
         self.queue = None
+        self.responses = None
+        self.workers = None
         self.resolvers = Resolvers(
             self.schd.data_store_mgr,
             schd=self.schd
@@ -159,8 +182,17 @@ class SuiteRuntimeServer(ZMQSocketBase):
         """
         # start accepting requests
         self.queue = Queue()
+        self.responses = Queue()
+        self.workers = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS,
+            thread_name_prefix='SuiteRuntimeServer',
+            initializer=_set_event_loop
+        )
         self.register_endpoints()
-        self._listener()
+        try:
+            self._listener()
+        finally:
+            self.workers.shutdown(wait=False)
 
     def _bespoke_stop(self):
         """Stop the listener and Authenticator.
@@ -174,7 +206,16 @@ class SuiteRuntimeServer(ZMQSocketBase):
             self.queue.put('STOP')
 
     def _listener(self):
-        """The server main loop, listen for and serve requests."""
+        """The server main loop, listen for and serve requests.
+
+        Requests are served concurrently by a pool of worker threads, except
+        for GraphQL mutations (e.g. task messages) which are quick, and are
+        served here so as not to queue them behind slow queries.
+
+        Responses are sent from here, ZMQ sockets are not thread safe.
+
+        """
+        n_pending = 0
         while True:
             # process any commands passed to the listener by its parent process
             if self.queue.qsize():
@@ -183,13 +224,28 @@ class SuiteRuntimeServer(ZMQSocketBase):
                     break
                 raise ValueError('Unknown command "%s"' % command)
 
+            # send back the responses from the workers
+            while n_pending:
+                try:
+                    frames = self.responses.get_nowait()
+                except Empty:
+                    break
+                n_pending -= 1
+                self._send(frames)
+
             try:
-                # wait RECV_TIMEOUT for a message
-                msg = self.socket.recv_string()
-            except zmq.error.Again:
-                # timeout, continue with the loop, this allows the listener
-                # thread to stop
-                continue
+                # wait for a message (only briefly if responses are pending)
+                if n_pending:
+                    timeout = self.BUSY_POLL_TIMEOUT
+                else:
+                    timeout = self.RECV_TIMEOUT
+                if not self.socket.poll(int(timeout * 1000)):
+                    # timeout, continue with the loop, this allows the listener
+                    # thread to stop
+                    continue
+                # (the client identity and the empty delimiter frame, then
+                # the message)
+                *envelope, msg = self.socket.recv_multipart()
             except zmq.error.ZMQError as exc:
                 LOG.exception('unexpected error: %s', exc)
                 continue
@@ -197,20 +253,18 @@ class SuiteRuntimeServer(ZMQSocketBase):
             # attempt to decode the message, authenticating the user in the
             # process
             try:
-                message = decode_(msg)
+                message = decode_(msg.decode())
             except Exception as exc:  # purposefully catch generic exception
                 # failed to decode message, possibly resulting from failed
                 # authentication
                 LOG.exception('failed to decode message: "%s"', exc)
             else:
                 # success case - serve the request
-                res = self._receiver(message)
-                if message['command'] in PB_METHOD_MAP:
-                    response = res['data']
+                if self._is_quick(message):
+                    self._send(envelope + [self._serve(message)])
                 else:
-                    response = encode_(res).encode()
-                # send back the string to bytes response
-                self.socket.send(response)
+                    n_pending += 1
+                    self.workers.submit(self._worker, envelope, message)
 
             # Note: we are using CurveZMQ to secure the messages (see
             # self.curve_auth, self.socket.curve_...key etc.). We have set up
@@ -219,6 +273,62 @@ class SuiteRuntimeServer(ZMQSocketBase):
 
             sleep(0)  # yield control to other threads
 
+    def _send(self, frames):
+        """Send a response (frames) back to its client."""
+        try:
+            self.socket.send_multipart(frames)
+        except zmq.error.ZMQError as exc:
+            LOG.exception('unexpected error: %s', exc)
+
+    @staticmethod
+    def _is_quick(message):
+        """Return True if the request should be served by the listener.
+
+        I.e. if it is a GraphQL request of mutations only. (The parsed
+        document is cached for the execution of the request.)
+
+        """
+        try:
+            if message['command'] != 'graphql':
+                return False
+            request_string = message['args']['request_string']
+            if not isinstance(request_string, str):
+                return False
+            document_ast, _ = parse_and_validate(schema, request_string)
+        except (GraphQLError, KeyError, TypeError):
+            return False
+        operations = [
+            definition.operation
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.OperationDefinition)
+        ]
+        return bool(operations) and all(
+            operation == 'mutation' for operation in operations)
+
+    def _worker(self, envelope, message):
+        """Serve a request in a worker thread, queue the response."""
+        try:
+            response = self._serve(message)
+        except Exception as exc:  # purposefully catch generic exception
+            # always respond, the client and the listener are waiting
+            LOG.exception(exc)
+            response = encode_({'error': {'message': str(exc)}}).encode()
+        self.responses.put(envelope + [response])
+
+    def _serve(self, message):
+        """Serve a request, return the response as bytes.
+
+        The data store is not changed by the scheduler while requests are
+        being served.
+
+        """
+        with self.schd.data_store_mgr.lock.read():
+            res = self._receiver(message)
+        if message['command'] in PB_METHOD_MAP:
+            return res['data']
+        # send back the string to bytes response
+        return encode_(res).encode()
+
     def _receiver(self, message):
         """Wrap incoming messages and dispatch them to exposed methods.
 
@@ -18,7 +18,7 @@
 
 import random
 import re
-from copy import deepcopy
+from copy import copy, deepcopy
 
 from cylc.flow.exceptions import PlatformLookupError
 from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
@@ -35,6 +35,11 @@ FORBIDDEN_WITH_PLATFORM = (
 HOST_REC_COMMAND = re.compile(r'(`|\$\()\s*(.*)\s*([`)])$')
 PLATFORM_REC_COMMAND = re.compile(r'(\$\()\s*(.*)\s*([)])$')
 
+# Platforms resolved from the global config by name:
+# [global config platforms, {platform name: platform}]
+# Reset whenever the global config platforms change (i.e. are reloaded).
+_PLATFORMS_CACHE = [None, {}]
+
 
 # BACK COMPAT: get_platform
 #     At Cylc 9 remove all Cylc7 upgrade logic.
@@ -162,12 +167,13 @@ def platform_from_name(platform_name=None, platforms=None):
             object containing settings for a platform, loaded from
             Global Config.
     """
+    use_cache = platforms is None
     if platforms is None:
         platforms = glbl_cfg().get(['platforms'])
     platform_groups = glbl_cfg().get(['platform groups'])
 
     if platform_name is None:
-        platform_data = deepcopy(platforms['localhost'])
+        platform_data = _copy_platform(platforms['localhost'])
         platform_data['name'] = 'localhost'
         return platform_data
 
@@ -179,14 +185,38 @@ def platform_from_name(platform_name=None, platforms=None):
                 platform_groups[platform_name_re]['platforms']
             )
 
+    if use_cache:
+        if _PLATFORMS_CACHE[0] is not platforms:
+            _PLATFORMS_CACHE[:] = [platforms, {}]
+        try:
+            platform_data = _PLATFORMS_CACHE[1][platform_name]
+        except KeyError:
+            platform_data = _platform_from_re(platform_name, platforms)
+            _PLATFORMS_CACHE[1][platform_name] = platform_data
+    else:
+        platform_data = _platform_from_re(platform_name, platforms)
+
+    # Copy prevents contaminating the (cached) platform with changes made
+    # by the caller.
+    platform_data = _copy_platform(platform_data)
+    if platform_group:
+        platform_data['group'] = platform_group
+    return platform_data
+
+
+def _platform_from_re(platform_name, platforms):
+    """Return the platform matching platform_name, for platform_from_name.
+
+    Raise PlatformLookupError if no platform matches.
+    """
     # The list is reversed to allow user-set platforms (which are loaded
     # later than site set platforms) to be matched first and override site
     # defined platforms.
     for platform_name_re in reversed(list(platforms)):
         if re.fullmatch(platform_name_re, platform_name):
-            # Deepcopy prevents contaminating platforms with data
+            # Copy prevents contaminating platforms with data
             # from other platforms matching platform_name_re
-            platform_data = deepcopy(platforms[platform_name_re])
+            platform_data = _copy_platform(platforms[platform_name_re])
 
             # If hosts are not filled in make remote
             # hosts the platform name.
@@ -200,14 +230,25 @@ def platform_from_name(platform_name=None, platforms=None):
                 platform_data['hosts'] = [platform_name]
             # Fill in the "private" name field.
             platform_data['name'] = platform_name
-            if platform_group:
-                platform_data['group'] = platform_group
             return platform_data
 
     raise PlatformLookupError(
         f"No matching platform \"{platform_name}\" found")
 
 
+def _copy_platform(platform_data):
+    """Return a copy of a platform.
+
+    Platform settings are scalars or lists of scalars, so this is
+    equivalent to, but much cheaper than, a deepcopy.
+    """
+    platform_data = copy(platform_data)
+    for key, value in platform_data.items():
+        if isinstance(value, list):
+            platform_data[key] = list(value)
+    return platform_data
+
+
 def platform_from_job_info(platforms, job, remote):
     """
     Find out which job platform to use given a list of possible platforms
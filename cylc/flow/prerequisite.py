@@ -16,7 +16,10 @@
 
 """Functionality for expressing and evaluating logical triggers."""
 
+from collections.abc import MutableMapping
+from functools import lru_cache
 import math
+from sys import intern
 
 from cylc.flow import ID_DELIM
 from cylc.flow.conditional_simplifier import ConditionalSimplifier
@@ -25,6 +28,64 @@ from cylc.flow.exceptions import TriggerExpressionError
 from cylc.flow.data_messages_pb2 import PbPrerequisite, PbCondition
 
 
+@lru_cache(maxsize=None)
+def _compile_condition(expr):
+    """Return a code object for a prerequisite condition expression.
+
+    Condition expressions refer to outputs by their index (see
+    Prerequisite.SATISFIED_TEMPLATE) so they are the same for every instance
+    of a task, and each is only compiled once.
+
+    """
+    return compile(expr, '<prerequisite>', 'eval')
+
+
+class _MessageStates(MutableMapping):
+    """Mapping view of the message states of a prerequisite.
+
+    {('task name', 'point string', 'output'): DEP_STATE_X, ...}
+
+    """
+
+    __slots__ = ['prereq']
+
+    def __init__(self, prereq):
+        self.prereq = prereq
+
+    def __getitem__(self, message):
+        return self.prereq._get_state(self.prereq._get_indexes()[message])
+
+    def __setitem__(self, message, state):
+        self.prereq._set_state(self.prereq._get_indexes()[message], state)
+
+    def __delitem__(self, message):
+        if message not in self.prereq._get_indexes():
+            raise KeyError(message)
+        self.prereq._remove_messages({message})
+
+    def __iter__(self):
+        return iter(self.prereq.messages)
+
+    def __len__(self):
+        return len(self.prereq.messages)
+
+    def __contains__(self, message):
+        return message in self.prereq._get_indexes()
+
+    def items(self):
+        get_state = self.prereq._get_state
+        return [
+            (message, get_state(ind))
+            for ind, message in enumerate(self.prereq.messages)]
+
+    def values(self):
+        get_state = self.prereq._get_state
+        return [get_state(ind) for ind in range(len(self.prereq.messages))]
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
 class Prerequisite:
     """The concrete result of an abstract logical trigger expression.
 
@@ -38,12 +99,13 @@ class Prerequisite:
     """
 
     # Memory optimization - constrain possible attributes to this list.
-    __slots__ = ["satisfied", "_all_satisfied",
-                 "target_point_strings", "start_point",
-                 "pre_initial_messages", "conditional_expression", "point"]
+    __slots__ = ["messages", "_indexes", "_satisfied_bits",
+                 "_overridden_bits", "_all_satisfied", "target_point_strings",
+                 "start_point", "pre_initial_messages",
+                 "conditional_expression", "point"]
 
-    # Extracts T from "foo.T succeeded" etc.
-    SATISFIED_TEMPLATE = 'bool(self.satisfied[("%s", "%s", "%s")])'
+    # Refers to the state of the n-th output in self.satisfied.
+    SATISFIED_TEMPLATE = 'bool(satisfied[%d])'
     MESSAGE_TEMPLATE = '%s.%s %s'
 
     DEP_STATE_SATISFIED = 'satisfied naturally'
@@ -59,19 +121,38 @@ class Prerequisite:
         # cylc.flow.cycling.PointBase
         self.start_point = start_point
 
-        # List of cycle point strings that this prerequisite depends on.
-        self.target_point_strings = []
-
-        # Dictionary of messages pertaining to this prerequisite.
-        # {('task name', 'point string', 'output'): DEP_STATE_X, ...}
-        self.satisfied = {}
+        # Tuple of cycle point strings that this prerequisite depends on.
+        self.target_point_strings = ()
+
+        # Messages pertaining to this prerequisite.
+        # (('task name', 'point string', 'output'), ...)
+        # (a list while the prerequisite is built by self.add)
+        self.messages = ()
+
+        # Index of each message in self.messages, built on demand and
+        # dropped once the prerequisite is built, so as not to hold a dict
+        # per prerequisite.
+        # {('task name', 'point string', 'output'): index, ...}
+        self._indexes = None
+
+        # The states of the messages, as bit arrays (ints) in which bit N
+        # refers to the N-th message:
+        # * satisfied bit set: DEP_STATE_SATISFIED
+        # * satisfied and overridden bits set: DEP_STATE_OVERRIDDEN
+        # * neither bit set: DEP_STATE_UNSATISFIED
+        # (Python caches small ints, so these cost nothing for prerequisites
+        # of up to 8 messages.)
+        self._satisfied_bits = 0
+        self._overridden_bits = 0
 
         # Messages pertaining to pre-initial dependencies.
-        # ['task name', 'point string' ,'output']
-        self.pre_initial_messages = []
+        # (('task name', 'point string' ,'output'), ...)
+        self.pre_initial_messages = ()
 
         # Expression present only when conditions are used.
-        # 'foo.1 failed & bar.1 succeeded'
+        # 'foo.1 failed | bar.1 succeeded'
+        # becomes
+        # 'bool(satisfied[0]) | bool(satisfied[1])'
         self.conditional_expression = None
 
         # The cached state of this prerequisite:
@@ -80,6 +161,72 @@ class Prerequisite:
         # * `False` (prerequisite unsatisfied).
         self._all_satisfied = None
 
+    @property
+    def satisfied(self):
+        """Mapping of messages to states.
+
+        {('task name', 'point string', 'output'): DEP_STATE_X, ...}
+
+        """
+        return _MessageStates(self)
+
+    def _get_indexes(self):
+        """Return {message: index, ...} for the messages."""
+        if self._indexes is None:
+            self._indexes = {
+                message: ind for ind, message in enumerate(self.messages)}
+        return self._indexes
+
+    def _get_state(self, ind):
+        """Return the state of the N-th message."""
+        bit = 1 << ind
+        if not self._satisfied_bits & bit:
+            return self.DEP_STATE_UNSATISFIED
+        if self._overridden_bits & bit:
+            return self.DEP_STATE_OVERRIDDEN
+        return self.DEP_STATE_SATISFIED
+
+    def _set_state(self, ind, state):
+        """Set the state of the N-th message."""
+        bit = 1 << ind
+        if not state:
+            self._satisfied_bits &= ~bit
+            self._overridden_bits &= ~bit
+        else:
+            self._satisfied_bits |= bit
+            if state == self.DEP_STATE_OVERRIDDEN:
+                self._overridden_bits |= bit
+            else:
+                self._overridden_bits &= ~bit
+
+    def _get_states_list(self):
+        """Return a list of whether each message is satisfied."""
+        bits = self._satisfied_bits
+        return [bool(bits >> ind & 1) for ind in range(len(self.messages))]
+
+    def _is_all_messages_satisfied(self):
+        """Return True if every message is satisfied."""
+        return self._satisfied_bits == (1 << len(self.messages)) - 1
+
+    def _remove_messages(self, drop_these):
+        """Remove a set of messages, keeping the states of the others."""
+        messages = []
+        satisfied_bits = 0
+        overridden_bits = 0
+        for ind, message in enumerate(self.messages):
+            if message in drop_these:
+                continue
+            bit = 1 << len(messages)
+            if self._satisfied_bits >> ind & 1:
+                satisfied_bits |= bit
+            if self._overridden_bits >> ind & 1:
+                overridden_bits |= bit
+            messages.append(message)
+        self.messages = tuple(messages)
+        self._satisfied_bits = satisfied_bits
+        self._overridden_bits = overridden_bits
+        self._indexes = None
+
     def add(self, name, point, output, pre_initial=False):
         """Register an output with this prerequisite.
 
@@ -91,16 +238,32 @@ class Prerequisite:
             pre_initial (bool): Set this output as a pre-initial dependency.
 
         """
-        message = (name, str(point), output)
+        # (intern the point string, to share it between the many
+        # prerequisites of the task proxies at the point)
+        point_string = intern(str(point))
+        message = (name, point_string, output)
+
+        if isinstance(self.messages, tuple):
+            # (built: back to lists until self.set_condition)
+            self.messages = list(self.messages)
+            self.target_point_strings = list(self.target_point_strings)
+            self.pre_initial_messages = list(self.pre_initial_messages)
 
         # Add a new prerequisite message in an UNSATISFIED state.
-        self.satisfied[message] = self.DEP_STATE_UNSATISFIED
+        indexes = self._get_indexes()
+        if message in indexes:
+            self._set_state(indexes[message], self.DEP_STATE_UNSATISFIED)
+            if pre_initial and message not in self.pre_initial_messages:
+                self.pre_initial_messages.append(message)
+        else:
+            indexes[message] = len(self.messages)
+            self.messages.append(message)
+            if pre_initial:
+                self.pre_initial_messages.append(message)
         if self._all_satisfied is not None:
             self._all_satisfied = False
-        if point and str(point) not in self.target_point_strings:
-            self.target_point_strings.append(str(point))
-        if pre_initial and message not in self.pre_initial_messages:
-            self.pre_initial_messages.append(message)
+        if point and point_string not in self.target_point_strings:
+            self.target_point_strings.append(point_string)
 
     def get_raw_conditional_expression(self):
         """Return a representation of this prereq as a string.
@@ -111,8 +274,8 @@ class Prerequisite:
         expr = self.conditional_expression
         if not expr:
             return None
-        for message in self.satisfied:
-            expr = expr.replace(self.SATISFIED_TEMPLATE % message,
+        for ind, message in enumerate(self.messages):
+            expr = expr.replace(self.SATISFIED_TEMPLATE % ind,
                                 self.MESSAGE_TEMPLATE % message)
         return expr
 
@@ -129,20 +292,27 @@ class Prerequisite:
         if self.pre_initial_messages:
             for message in self.pre_initial_messages:
                 drop_these.append(message)
+        drop_set = set(drop_these)
 
         # Needed to drop pre warm-start dependence:
-        for message in self.satisfied:
-            if message in drop_these:
+        for message in self.messages:
+            if message in drop_set:
                 continue
             if self.start_point:
                 if message[1]:  # Cycle point.
                     if get_point(message[1]) < self.start_point <= self.point:
                         # Drop if outside of relevant point range.
                         drop_these.append(message)
+                        drop_set.add(message)
 
-        for message in drop_these:
-            if message in self.satisfied:
-                self.satisfied.pop(message)
+        # The prerequisite is built: store compactly.
+        if drop_set:
+            self._remove_messages(drop_set)
+        else:
+            self.messages = tuple(self.messages)
+            self._indexes = None
+        self.target_point_strings = tuple(self.target_point_strings)
+        self.pre_initial_messages = tuple(self.pre_initial_messages)
 
         if '|' in expr:
             if drop_these:
@@ -150,10 +320,11 @@ class Prerequisite:
                     expr, [self.MESSAGE_TEMPLATE % m for m in drop_these])
                 expr = simpler.get_cleaned()
             # Make a Python expression so we can eval() the logic.
-            for message in self.satisfied:
+            for ind, message in enumerate(self.messages):
                 expr = expr.replace(self.MESSAGE_TEMPLATE % message,
-                                    self.SATISFIED_TEMPLATE % message)
-            self.conditional_expression = expr
+                                    self.SATISFIED_TEMPLATE % ind)
+            # (the same for every instance of a task)
+            self.conditional_expression = intern(expr)
 
     def is_satisfied(self):
         """Return True if prerequisite is satisfied.
@@ -165,14 +336,14 @@ class Prerequisite:
             return self._all_satisfied
         else:
             # No cached value.
-            if self.satisfied == {}:
+            if not self.messages:
                 # No prerequisites left after pre-initial simplification.
                 return True
             if self.conditional_expression:
                 # Trigger expression with at least one '|': use eval.
                 self._all_satisfied = self._conditional_is_satisfied()
             else:
-                self._all_satisfied = all(self.satisfied.values())
+                self._all_satisfied = self._is_all_messages_satisfied()
             return self._all_satisfied
 
     def _conditional_is_satisfied(self):
@@ -182,7 +353,9 @@ class Prerequisite:
 
         """
         try:
-            res = eval(self.conditional_expression)
+            res = eval(  # nosec
+                _compile_condition(self.conditional_expression),
+                {'satisfied': self._get_states_list()})
         except (SyntaxError, ValueError) as exc:
             err_msg = str(exc)
             if str(exc).find("unexpected EOF") != -1:
@@ -198,13 +371,18 @@ class Prerequisite:
         Updates cache with the evaluation result.
 
         """
-        relevant_messages = all_task_outputs & set(self.satisfied)
-        for message in relevant_messages:
-            self.satisfied[message] = self.DEP_STATE_SATISFIED
-            if self.conditional_expression is None:
-                self._all_satisfied = all(self.satisfied.values())
-            else:
-                self._all_satisfied = self._conditional_is_satisfied()
+        relevant_messages = set()
+        for ind, message in enumerate(self.messages):
+            if message in all_task_outputs:
+                relevant_messages.add(message)
+                self._set_state(ind, self.DEP_STATE_SATISFIED)
+        if not relevant_messages:
+            return relevant_messages
+        # evaluate once for the whole batch of outputs
+        if self.conditional_expression is None:
+            self._all_satisfied = self._is_all_messages_satisfied()
+        else:
+            self._all_satisfied = self._conditional_is_satisfied()
         return relevant_messages
 
     def dump(self):
@@ -214,18 +392,18 @@ class Prerequisite:
         if self.conditional_expression:
             temp = self.get_raw_conditional_expression()
             messages = []
-            num_length = math.ceil(len(self.satisfied) / 10)
-            for ind, message_tuple in enumerate(sorted(self.satisfied)):
+            num_length = math.ceil(len(self.messages) / 10)
+            for ind, (message_tuple, val) in enumerate(
+                    sorted(self.satisfied.items())):
                 message = self.MESSAGE_TEMPLATE % message_tuple
                 char = '%.{0}d'.format(num_length) % ind
-                messages.append(['\t%s = %s' % (char, message),
-                                 bool(self.satisfied[message_tuple])])
+                messages.append(['\t%s = %s' % (char, message), bool(val)])
                 temp = temp.replace(message, char)
             temp = temp.replace('|', ' | ')
             temp = temp.replace('&', ' & ')
             res.append([temp, self.is_satisfied()])
             res.extend(messages)
-        elif self.satisfied:
+        elif self.messages:
             for message, val in self.satisfied.items():
                 res.append([self.MESSAGE_TEMPLATE % message, val])
         # (Else trigger wiped out by pre-initial simplification.)
@@ -233,23 +411,22 @@ class Prerequisite:
 
     def api_dump(self, workflow_id):
         """Return list of populated Protobuf data objects."""
-        if not self.satisfied:
+        if not self.messages:
             return None
         if self.conditional_expression:
             temp = self.get_raw_conditional_expression()
             temp = temp.replace('|', ' | ')
             temp = temp.replace('&', ' & ')
         else:
-            for s_msg in self.satisfied:
-                temp = self.MESSAGE_TEMPLATE % s_msg
+            temp = self.MESSAGE_TEMPLATE % self.messages[-1]
         conds = []
-        num_length = math.ceil(len(self.satisfied) / 10)
-        for ind, message_tuple in enumerate(sorted(self.satisfied)):
+        num_length = math.ceil(len(self.messages) / 10)
+        for ind, (message_tuple, c_val) in enumerate(
+                sorted(self.satisfied.items())):
             name, point = message_tuple[0:2]
             t_id = f"{workflow_id}{ID_DELIM}{point}{ID_DELIM}{name}"
             char = 'c%.{0}d'.format(num_length) % ind
             c_msg = self.MESSAGE_TEMPLATE % message_tuple
-            c_val = self.satisfied[message_tuple]
             c_bool = bool(c_val)
             if c_bool is False:
                 c_val = "unsatisfied"
@@ -276,23 +453,29 @@ class Prerequisite:
         State can be overridden by calling `self.satisfy_me`.
 
         """
-        for message in self.satisfied:
-            if not self.satisfied[message]:
-                self.satisfied[message] = self.DEP_STATE_OVERRIDDEN
+        all_bits = (1 << len(self.messages)) - 1
+        self._overridden_bits |= all_bits & ~self._satisfied_bits
+        self._satisfied_bits = all_bits
         if self.conditional_expression is None:
             self._all_satisfied = True
         else:
             self._all_satisfied = self._conditional_is_satisfied()
 
+    def set_states(self, states):
+        """Set the state of each message from {message: state, ...}."""
+        for ind, message in enumerate(self.messages):
+            self._set_state(ind, states[message])
+        self._all_satisfied = None
+
     def set_not_satisfied(self):
         """Force this prerequisite into the un-satisfied state.
 
         State can be overridden by calling `self.satisfy_me`.
 
         """
-        for message in self.satisfied:
-            self.satisfied[message] = self.DEP_STATE_UNSATISFIED
-        if not self.satisfied:
+        self._satisfied_bits = 0
+        self._overridden_bits = 0
+        if not self.messages:
             self._all_satisfied = True
         elif self.conditional_expression is None:
             self._all_satisfied = False
@@ -310,6 +493,7 @@ class Prerequisite:
         E.G: ['foo.1', 'bar.2']
 
         """
+        resolved = self._satisfied_bits & ~self._overridden_bits
         return [f'{name}.{point}' for
-                (name, point, _), satisfied in self.satisfied.items() if
-                satisfied == self.DEP_STATE_SATISFIED]
+                ind, (name, point, _) in enumerate(self.messages) if
+                resolved >> ind & 1]
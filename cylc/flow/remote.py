@@ -15,6 +15,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Run command on a remote, (i.e. a remote [user@]host)."""
 
+from functools import lru_cache
 import os
 from shlex import quote
 from posix import WIFSIGNALED
@@ -167,7 +168,14 @@ def construct_rsync_over_ssh_cmd(
     """
     dst_host = get_host_from_platform(platform)
     rsync_cmd = ["rsync"]
-    ssh_cmd = platform['ssh command']
+    ssh_cmd = ' '.join(
+        [platform['ssh command']]
+        + [
+            quote(opt)
+            for opt in get_ssh_persist_opts(
+                platform['ssh connection persist'])
+        ]
+    )
     rsync_options = [
         "-v",
         "--perms",
@@ -214,10 +222,46 @@ def construct_ssh_cmd(raw_cmd, platform, **kwargs):
         ssh_cmd=platform['ssh command'],
         ssh_cylc=platform['cylc executable'],
         ssh_login_shell=platform['use login shell'],
+        ssh_persist=platform['ssh connection persist'],
         **kwargs
     )
 
 
+@lru_cache()
+def _make_ssh_control_dir(control_dir):
+    """Create the directory for SSH control sockets (once) and return it."""
+    os.makedirs(control_dir, mode=0o700, exist_ok=True)
+    return control_dir
+
+
+def get_ssh_persist_opts(ssh_persist):
+    """Return SSH options to share one connection per host between commands.
+
+    The first command to a host starts a master connection, which later
+    commands to the same host reuse rather than connecting afresh. The
+    master connection closes when it has been idle for "ssh_persist"
+    seconds, and is started again on demand by the next command.
+
+    Args:
+        ssh_persist (float):
+            Idle time before the shared connection is closed. If not set,
+            connections are not shared.
+
+    Return:
+        A list of SSH options.
+    """
+    if not ssh_persist:
+        return []
+    control_dir = _make_ssh_control_dir(
+        os.path.expanduser(os.path.join('~', '.cylc', 'ssh')))
+    return [
+        '-oControlMaster=auto',
+        # %C is a hash of the local host, remote host, port and user
+        '-oControlPath=%s' % os.path.join(control_dir, '%C'),
+        '-oControlPersist=%d' % ssh_persist,
+    ]
+
+
 def _construct_ssh_cmd(
         raw_cmd,
         host=None,
@@ -226,6 +270,7 @@ def _construct_ssh_cmd(
         ssh_cmd=None,
         ssh_login_shell=None,
         ssh_cylc=None,
+        ssh_persist=None,
         set_UTC=False,
         allow_flag_opts=False,
         timeout=None
@@ -247,6 +292,9 @@ def _construct_ssh_cmd(
             If True, launch remote command with `bash -l -c 'exec "$0" "$@"'`.
         ssh_cylc (string):
             Location of the remote cylc executable.
+        ssh_persist (float):
+            If set, share one SSH connection per host between commands,
+            closing it after this many seconds idle.
         set_UTC (boolean):
             If True, check UTC mode and specify if set to True (non-default).
         allow_flag_opts (boolean):
@@ -264,6 +312,7 @@ def _construct_ssh_cmd(
         command = shlex.split(get_platform()['ssh command'])
     else:
         command = shlex.split(ssh_cmd)
+    command += get_ssh_persist_opts(ssh_persist)
 
     if forward_x11:
         command.append('-Y')
@@ -344,6 +393,7 @@ def remote_cylc_cmd(cmd, platform, **kwargs):
         ssh_cmd=platform['ssh command'],
         ssh_cylc=platform['cylc executable'],
         ssh_login_shell=platform['use login shell'],
+        ssh_persist=platform['ssh connection persist'],
         **kwargs
     )
 
@@ -356,6 +406,7 @@ def _remote_cylc_cmd(
         ssh_login_shell=None,
         ssh_cmd=None,
         ssh_cylc=None,
+        ssh_persist=None,
         capture_process=False,
         manage=False
 ):
@@ -376,7 +427,8 @@ def _remote_cylc_cmd(
             stdin=True if stdin_str else stdin,
             ssh_login_shell=ssh_login_shell,
             ssh_cmd=ssh_cmd,
-            ssh_cylc=ssh_cylc
+            ssh_cylc=ssh_cylc,
+            ssh_persist=ssh_persist
         ),
         stdin=stdin,
         stdin_str=stdin_str,
@@ -15,6 +15,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Provide data access object for the suite runtime database."""
 
+import os
 import sqlite3
 import traceback
 from os.path import expandvars
@@ -166,6 +167,7 @@ class CylcSuiteDAO:
 
     CONN_TIMEOUT = 0.2
     DB_FILE_BASE_NAME = "db"
+    MAX_HOST_PARAMS = 500  # SQLite < 3.32 allows at most 999 per statement
     MAX_TRIES = 100
     RESTART_INCOMPAT_VERSION = "8.0a2"  # Can't restart suite if <= this vers
     TABLE_BROADCAST_EVENTS = "broadcast_events"
@@ -308,6 +310,8 @@ class CylcSuiteDAO:
         self.db_file_name = expandvars(db_file_name)
         self.is_public = is_public
         self.conn = None
+        # Inode of the database file at connection time (None if unknown).
+        self.conn_inode = None
         self.n_tries = 0
 
         self.tables = {}
@@ -357,13 +361,34 @@ class CylcSuiteDAO:
             except sqlite3.Error:
                 pass
             self.conn = None
+            self.conn_inode = None
 
     def connect(self):
         """Connect to the database."""
         if self.conn is None:
             self.conn = sqlite3.connect(self.db_file_name, self.CONN_TIMEOUT)
+            self.conn_inode = self._get_inode()
         return self.conn
 
+    def _get_inode(self):
+        """Return the inode of the database file, or None if not a file."""
+        try:
+            return os.stat(self.db_file_name).st_ino
+        except OSError:
+            return None
+
+    def _check_conn(self):
+        """Close the connection if the database file has gone or changed.
+
+        If the suite run directory is removed, the forced reconnection to the
+        private database will ensure that the suite dies.
+        """
+        if (
+            self.conn_inode is not None
+            and self._get_inode() != self.conn_inode
+        ):
+            self.close()
+
     def create_tables(self):
         """Create tables."""
         names = []
@@ -379,7 +404,14 @@ class CylcSuiteDAO:
             self.conn.commit()
 
     def execute_queued_items(self):
-        """Execute queued items for each table."""
+        """Execute queued items for each table.
+
+        The connection to the private database is kept open between calls
+        (so that SQLite can reuse its cached prepared statements), the
+        connection to the public database is closed after each call.
+        """
+        if not self.is_public:
+            self._check_conn()
         try:
             for table in self.tables.values():
                 # DELETE statements may have varying number of WHERE args so we
@@ -402,6 +434,9 @@ class CylcSuiteDAO:
             self.conn.commit()
         except sqlite3.Error:
             if not self.is_public:
+                # Discard the partial transaction (and its lock), so that a
+                # later commit on this connection does not commit it.
+                self.close()
                 raise
             self.n_tries += 1
             LOG.warning(
@@ -426,10 +461,10 @@ class CylcSuiteDAO:
                         "file": self.db_file_name, "attempt": self.n_tries})
             self.n_tries = 0
         finally:
-            # Note: This is not strictly necessary. However, if the suite run
-            # directory is removed, a forced reconnection to the private
-            # database will ensure that the suite dies.
-            self.close()
+            if self.is_public:
+                # The public database may be replaced by a fresh copy of the
+                # private database at any time.
+                self.close()
 
     def _execute_stmt(self, stmt, stmt_args_list):
         """Helper for "self.execute_queued_items".
@@ -642,6 +677,43 @@ class CylcSuiteDAO:
             ret[flow_label] = submit_num
         return ret
 
+    def select_cycles(self, table_name):
+        """Return the set of distinct cycle points (str) in a table."""
+        # Ignore bandit false positive: B608: hardcoded_sql_expressions
+        # Not an injection, simply putting the table name in the SQL query
+        # expression as a string constant local to this module.
+        stmt = f"SELECT DISTINCT cycle FROM {table_name}"  # nosec
+        return set(i[0] for i in self.connect().execute(stmt))
+
+    def select_submit_nums_for_restart(self, callback, cycles=None):
+        """Select name, cycle, flow_label, submit_num from task_states.
+
+        If cycles (an iterable of cycle point strings) is given, only select
+        rows of those cycle points.
+
+        Invoke callback(row_idx, row) on each row.
+        """
+        stmt = (  # nosec
+            r"SELECT name,cycle,flow_label,submit_num FROM %(name)s"
+        ) % {"name": self.TABLE_TASK_STATES}
+        if cycles is None:
+            queries = [(stmt, [])]
+        else:
+            # Keep within the SQLite limit on the number of host parameters.
+            cycles = sorted(cycles)
+            queries = []
+            for ind in range(0, len(cycles), self.MAX_HOST_PARAMS):
+                stmt_args = cycles[ind:ind + self.MAX_HOST_PARAMS]
+                queries.append((
+                    stmt + r" WHERE cycle IN (%s)" % ",".join(
+                        "?" * len(stmt_args)),
+                    stmt_args))
+        row_idx = 0
+        for query_stmt, stmt_args in queries:
+            for row in self.connect().execute(query_stmt, stmt_args):
+                callback(row_idx, list(row))
+                row_idx += 1
+
     def select_xtriggers_for_restart(self, callback):
         stm = r"SELECT signature,results FROM %s" % self.TABLE_XTRIGGERS
         for row_idx, row in enumerate(self.connect().execute(stm, [])):
@@ -127,6 +127,23 @@ class SchedulerUUID:
         return self.value
 
 
+class SchedulerQueue(Queue):
+    """A queue which wakes up the scheduler main loop on put.
+
+    Items may be put by other threads (e.g. the server thread) so the
+    wakeup callable must be thread safe.
+
+    """
+
+    def __init__(self, wakeup):
+        super().__init__()
+        self.wakeup = wakeup
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self.wakeup()
+
+
 @dataclass
 class Scheduler:
     """Cylc scheduler server."""
@@ -202,6 +219,8 @@ class Scheduler:
     # main loop
     main_loop_intervals: deque = deque(maxlen=10)
     main_loop_plugins: dict = None
+    main_loop_wakeup: asyncio.Event = None
+    main_loop_event_loop: asyncio.AbstractEventLoop = None
     auto_restart_mode: AutoRestartMode = None
     auto_restart_time: float = None
 
@@ -362,10 +381,12 @@ class Scheduler:
         self.publisher = WorkflowPublisher(
             self.suite, context=self.zmq_context, barrier=self.barrier)
 
-        self.proc_pool = SubProcPool()
-        self.command_queue = Queue()
-        self.message_queue = Queue()
-        self.ext_trigger_queue = Queue()
+        self.main_loop_event_loop = asyncio.get_event_loop()
+        self.main_loop_wakeup = asyncio.Event()
+        self.proc_pool = SubProcPool(self.wakeup)
+        self.command_queue = SchedulerQueue(self.wakeup)
+        self.message_queue = SchedulerQueue(self.wakeup)
+        self.ext_trigger_queue = SchedulerQueue(self.wakeup)
         self.suite_event_handler = SuiteEventHandler(self.proc_pool)
 
         self.xtrigger_mgr = XtriggerManager(
@@ -415,9 +436,12 @@ class Scheduler:
             # This logic handles lack of initial cycle point in "flow.cylc".
             # Things that can't change on suite reload.
             pri_dao = self.suite_db_mgr.get_pri_dao()
-            pri_dao.select_suite_params(self._load_suite_params)
-            pri_dao.select_suite_template_vars(self._load_template_vars)
-            pri_dao.execute_queued_items()
+            try:
+                pri_dao.select_suite_params(self._load_suite_params)
+                pri_dao.select_suite_template_vars(self._load_template_vars)
+                pri_dao.execute_queued_items()
+            finally:
+                pri_dao.close()
 
         # Copy local python modules from source to run directory
         for sub_dir in ["python", os.path.join("lib", "python")]:
@@ -690,6 +714,7 @@ class Scheduler:
             self.broadcast_mgr.load_db_broadcast_states)
         self.suite_db_mgr.pri_dao.select_task_job_run_times(
             self._load_task_run_times)
+        self.suite_db_mgr.load_submit_nums_for_restart()
         self.suite_db_mgr.pri_dao.select_task_pool_for_restart(
             self.pool.load_db_task_pool_for_restart)
         self.suite_db_mgr.pri_dao.select_jobs_for_restart(
@@ -773,13 +798,15 @@ class Scheduler:
             messages.setdefault(task_id, [])
             messages[task_id].append(
                 (submit_num, event_time, severity, message))
+        if not messages:
+            return
         # Note on to_poll_tasks: If an incoming message is going to cause a
         # reverse change to task state, it is desirable to confirm this by
         # polling.
         to_poll_tasks = []
-        for itask in self.pool.get_tasks():
-            message_items = messages.get(itask.identity)
-            if message_items is None:
+        for task_id, message_items in messages.items():
+            itask = self.pool.get_pool_task_by_id(task_id)
+            if itask is None:
                 continue
             should_poll = False
             for submit_num, event_time, severity, message in message_items:
@@ -955,7 +982,10 @@ class Scheduler:
         old_tasks = set(self.config.get_task_name_list())
         # Things that can't change on suite reload:
         pri_dao = self.suite_db_mgr.get_pri_dao()
-        pri_dao.select_suite_params(self._load_suite_params)
+        try:
+            pri_dao.select_suite_params(self._load_suite_params)
+        finally:
+            pri_dao.close()
 
         self.load_flow_file(is_reload=True)
         self.broadcast_mgr.linearized_ancestors = (
@@ -1401,10 +1431,42 @@ class Scheduler:
             self.is_updated = True
             self.task_events_mgr.pflag = True
 
+    def wakeup(self):
+        """Wake up the main loop if it is sleeping.
+
+        Called when items are put in the command, message or external trigger
+        queues. Thread safe.
+
+        """
+        try:
+            self.main_loop_event_loop.call_soon_threadsafe(
+                self.main_loop_wakeup.set)
+        except RuntimeError:
+            # event loop closed (e.g. server thread still running on
+            # shutdown)
+            pass
+
+    async def main_loop_sleep(self, duration):
+        """Sleep for up to duration seconds, or until woken up.
+
+        Always yields control to other coroutines.
+
+        """
+        if duration > 0:
+            try:
+                await asyncio.wait_for(self.main_loop_wakeup.wait(), duration)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(0)
+
     async def main_loop(self):
         """The scheduler main loop."""
         while True:  # MAIN LOOP
             tinit = time()
+            # Anything queued from here on will be picked up by this pass
+            # or will wake up the next one.
+            self.main_loop_wakeup.clear()
 
             if self.pool.do_reload:
                 # Re-initialise data model on reload
@@ -1461,9 +1523,12 @@ class Scheduler:
             # Sleep a bit for things to catch up.
             # Quick sleep if there are items pending in process pool.
             # (Should probably use quick sleep logic for other queues?)
+            # Don't sleep if the last pass changed task states, so that
+            # e.g. downstream tasks get submitted straight away.
             elapsed = time() - tinit
             quick_mode = self.proc_pool.is_not_done()
-            if (elapsed >= self.INTERVAL_MAIN_LOOP or
+            if (self.task_events_mgr.pflag or
+                    elapsed >= self.INTERVAL_MAIN_LOOP or
                     quick_mode and elapsed >= self.INTERVAL_MAIN_LOOP_QUICK):
                 # Main loop has taken quite a bit to get through
                 # Still yield control to other threads by sleep(0.0)
@@ -1472,7 +1537,7 @@ class Scheduler:
                 duration = self.INTERVAL_MAIN_LOOP_QUICK - elapsed
             else:
                 duration = self.INTERVAL_MAIN_LOOP - elapsed
-            await asyncio.sleep(duration)
+            await self.main_loop_sleep(duration)
             # Record latest main loop interval
             self.main_loop_intervals.append(time() - tinit)
             # END MAIN LOOP
@@ -15,6 +15,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Manage queueing and pooling of subprocesses for the suite server program."""
 
+import asyncio
 from collections import deque
 import json
 import os
@@ -106,6 +107,12 @@ class SubProcPool:
     SubProcContext object as they are read. STDIN can also be specified for the
     command. This is currently fed into the command using a temporary file.
 
+    While a command runs, its STDOUT and STDERR are drained into byte buffers
+    (to stop a full pipe from blocking the command) and are decoded once on
+    exit. If a `wakeup` callable is given, the pipes are also drained from the
+    asyncio event loop between calls to `.process`, and the caller is woken up
+    when a command closes its pipes, i.e. when it exits.
+
     Note: For a cylc command that uses
     `cylc.flow.option_parsers.CylcOptionParser`, the default logging handler
     writes to the STDERR via a StreamHandler. Therefore, log messages will
@@ -115,11 +122,14 @@ class SubProcPool:
     """
 
     ERR_SUITE_STOPPING = 'suite stopping, command not run'
+    INTERVAL_EXIT_WAKEUP = 0.1
     JOBS_SUBMIT = 'jobs-submit'
     POLLREAD = select.POLLIN | select.POLLPRI
+    # poll reports EOF on a pipe as POLLHUP, and not necessarily POLLIN
+    POLLREAD_OR_EOF = POLLREAD | select.POLLHUP
     RET_CODE_SUITE_STOPPING = 999
 
-    def __init__(self):
+    def __init__(self, wakeup=None):
         self.size = glbl_cfg().get(['scheduler', 'process pool size'])
         self.proc_pool_timeout = glbl_cfg().get(
             ['scheduler', 'process pool timeout'])
@@ -133,6 +143,18 @@ class SubProcPool:
             self.pipepoller = select.poll()
         except AttributeError:  # select.poll not implemented for this OS
             self.pipepoller = None
+        # Data read so far from the pipes of running commands.
+        # {fileno: bytearray}
+        self.pipe_buffers = {}
+        # Pipes of running commands which have not reached EOF yet.
+        self.open_filenos = set()
+        # Callable to wake up the caller when a pipe is readable (or None).
+        self.wakeup = wakeup
+        # File descriptors watched by the asyncio event loop.
+        self.watched_filenos = set()
+        # PIDs of commands which have closed their pipes but not yet exited,
+        # for which a delayed wakeup has been scheduled.
+        self.exit_wakeup_pids = set()
 
     def close(self):
         """Close pool."""
@@ -160,7 +182,12 @@ class SubProcPool:
     def _proc_exit(self, proc, err_xtra, ctx, callback, callback_args):
         """Get ret_code, out, err of exited command, and call its callback."""
         ctx.ret_code = proc.wait()
-        out, err = (f.decode() for f in proc.communicate())
+        self.exit_wakeup_pids.discard(proc.pid)
+        out_buf = self._unregister_pipe(proc.stdout)
+        err_buf = self._unregister_pipe(proc.stderr)
+        out, err = proc.communicate()
+        out = (out_buf + out).decode()
+        err = (err_buf + err).decode()
         if out:
             if ctx.out is None:
                 ctx.out = ''
@@ -173,6 +200,9 @@ class SubProcPool:
 
     def process(self):
         """Process done child processes and submit more."""
+        # Unblock STDOUT/STDERR of running commands if necessary. Otherwise, a
+        # full STDOUT or STDERR may stop a command from proceeding.
+        self._poll_proc_pipes()
         # Handle child processes that are done
         runnings = []
         for proc, ctx, callback, callback_args in self.runnings:
@@ -192,11 +222,19 @@ class SubProcPool:
                         self.proc_pool_timeout)
                 self._proc_exit(proc, err_xtra, ctx, callback, callback_args)
                 continue
-            # Command still running, see if STDOUT/STDERR are readable or not
+            # Command still running
             runnings.append([proc, ctx, callback, callback_args])
-            # Unblock proc's STDOUT/STDERR if necessary. Otherwise, a full
-            # STDOUT or STDERR may stop command from proceeding.
-            self._poll_proc_pipes(proc, ctx)
+            if (
+                self.wakeup is not None
+                and proc.pid not in self.exit_wakeup_pids
+                and proc.stdout.fileno() not in self.open_filenos
+                and proc.stderr.fileno() not in self.open_filenos
+            ):
+                # Command has closed its STDOUT and STDERR, it is most likely
+                # exiting, wake up the caller (once) to handle it shortly.
+                self.exit_wakeup_pids.add(proc.pid)
+                asyncio.get_event_loop().call_later(
+                    self.INTERVAL_EXIT_WAKEUP, self.wakeup)
 
         # Update list of running items
         self.runnings[:] = runnings
@@ -213,6 +251,9 @@ class SubProcPool:
                 if proc is not None:
                     ctx.timeout = time() + self.proc_pool_timeout
                     self.runnings.append([proc, ctx, callback, callback_args])
+                    self._register_pipe(proc.stdout)
+                    self._register_pipe(proc.stderr)
+        self._watch_pipes()
 
     def put_command(self, ctx, callback=None, callback_args=None):
         """Queue a new shell command to execute.
@@ -271,57 +312,106 @@ class SubProcPool:
         # Wait for child processes
         self.process()
 
-    def _poll_proc_pipes(self, proc, ctx):
-        """Poll STDOUT/ERR of proc and read some data if possible.
-
-        This helps to unblock the command by unblocking its pipes.
+    def _register_pipe(self, handle):
+        """Start buffering data from the STDOUT/ERR pipe of a command."""
+        fileno = handle.fileno()
+        self.pipe_buffers[fileno] = bytearray()
+        self.open_filenos.add(fileno)
+        if self.pipepoller is not None:
+            self.pipepoller.register(fileno, self.POLLREAD)
+
+    def _unregister_pipe(self, handle):
+        """Stop buffering data from a pipe, return the data read so far."""
+        if handle.closed:
+            return b''
+        fileno = handle.fileno()
+        self._unwatch_pipe(fileno)
+        buf = self.pipe_buffers.pop(fileno, None)
+        if buf is None:
+            return b''
+        if fileno in self.open_filenos:
+            self.open_filenos.discard(fileno)
+            if self.pipepoller is not None:
+                self.pipepoller.unregister(fileno)
+        return bytes(buf)
+
+    def _poll_proc_pipes(self):
+        """Poll STDOUT/ERR of running commands and read data if possible.
+
+        This helps to unblock the commands by unblocking their pipes.
         """
         if self.pipepoller is None:
             return  # select.poll not supported on this OS
-        for handle in [proc.stdout, proc.stderr]:
-            if not handle.closed:
-                self.pipepoller.register(handle.fileno(), self.POLLREAD)
         while True:
             fileno_list = [
                 fileno
                 for fileno, event in self.pipepoller.poll(0.0)
-                if event & self.POLLREAD]
+                if event & self.POLLREAD_OR_EOF]
             if not fileno_list:
                 # Nothing readable
                 break
-            received_data = []
             for fileno in fileno_list:
-                # If a file handle is readable, read something from it, add
-                # results into the command context object's `.out` or `.err`,
-                # whichever is relevant. To avoid blocking:
+                # If a file handle is readable, read something from it and add
+                # it to the relevant buffer. To avoid blocking:
                 # 1. Use `os.read` here instead of `file.read` to avoid any
                 #    buffering that may cause the file handle to block.
                 # 2. Call os.read only once after a poll. Poll again before
                 #    another read - otherwise the os.read call may block.
                 try:
-                    data = os.read(fileno, 65536).decode()  # 64K
+                    data = os.read(fileno, 65536)  # 64K
                 except OSError:
-                    continue
-                received_data.append(data != '')
-                if fileno == proc.stdout.fileno():
-                    if ctx.out is None:
-                        ctx.out = ''
-                    ctx.out += data
-                elif fileno == proc.stderr.fileno():
-                    if ctx.err is None:
-                        ctx.err = ''
-                    ctx.err += data
-            if received_data and not all(received_data):
-                # if no data was pushed down the pipe exit the polling loop,
-                # we can always re-enter the polling loop later if there is
-                # more data
-                # NOTE: this suppresses an infinite polling-loop observed
-                # on darwin see:
-                # https://github.com/cylc/cylc-flow/issues/3535
-                # https://github.com/cylc/cylc-flow/pull/3543
-                return
-        self.pipepoller.unregister(proc.stdout.fileno())
-        self.pipepoller.unregister(proc.stderr.fileno())
+                    data = b''
+                if data:
+                    self.pipe_buffers[fileno] += data
+                else:
+                    # EOF (or error), nothing more to read until the command
+                    # exits. Unregister so that we don't keep on polling it.
+                    # NOTE: this also suppresses an infinite polling-loop
+                    # observed on darwin see:
+                    # https://github.com/cylc/cylc-flow/issues/3535
+                    # https://github.com/cylc/cylc-flow/pull/3543
+                    self.pipepoller.unregister(fileno)
+                    self.open_filenos.discard(fileno)
+                    self._unwatch_pipe(fileno)
+
+    def _watch_pipes(self):
+        """Drain the pipes of running commands from the asyncio event loop.
+
+        Each pipe is watched until it reaches EOF, at which point the caller
+        is woken up. Output written before then is buffered without waking
+        the caller, so that chatty commands do not cause extra main loop
+        passes.
+        """
+        if self.wakeup is None:
+            return
+        loop = asyncio.get_event_loop()
+        for fileno in self.open_filenos - self.watched_filenos:
+            loop.add_reader(fileno, self._on_pipe_readable, fileno)
+            self.watched_filenos.add(fileno)
+
+    def _unwatch_pipe(self, fileno):
+        """Stop watching a pipe from the asyncio event loop."""
+        if fileno in self.watched_filenos:
+            self.watched_filenos.discard(fileno)
+            asyncio.get_event_loop().remove_reader(fileno)
+
+    def _on_pipe_readable(self, fileno):
+        """Callback for pipes watched by the asyncio event loop."""
+        # Read once only, see _poll_proc_pipes.
+        try:
+            data = os.read(fileno, 65536)  # 64K
+        except OSError:
+            data = b''
+        if data:
+            self.pipe_buffers[fileno] += data
+            return
+        # EOF (or error), the command is most likely exiting.
+        self._unwatch_pipe(fileno)
+        if fileno in self.open_filenos:
+            self.open_filenos.discard(fileno)
+            if self.pipepoller is not None:
+                self.pipepoller.unregister(fileno)
+        self.wakeup()
 
     @classmethod
     def _run_command_init(cls, ctx, callback=None, callback_args=None):
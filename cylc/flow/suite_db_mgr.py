@@ -32,6 +32,7 @@ from tempfile import mkstemp
 
 from cylc.flow import LOG
 from cylc.flow.broadcast_report import get_broadcast_change_iter
+from cylc.flow.cycling.loader import get_point
 from cylc.flow.rundb import CylcSuiteDAO
 from cylc.flow import __version__ as CYLC_VERSION
 from cylc.flow.wallclock import get_current_time_string, get_utc_mode
@@ -76,6 +77,15 @@ class SuiteDatabaseManager:
     TABLE_XTRIGGERS = CylcSuiteDAO.TABLE_XTRIGGERS
     TABLE_ABS_OUTPUTS = CylcSuiteDAO.TABLE_ABS_OUTPUTS
 
+    # Tables written by put_task_pool, with their primary key columns.
+    TASK_POOL_TABLE_KEYS = {
+        TABLE_TASK_POOL: ("cycle", "name", "flow_label"),
+        TABLE_TASK_PREREQUISITES: (
+            "cycle", "name", "prereq_name", "prereq_cycle", "prereq_output"),
+        TABLE_TASK_TIMEOUT_TIMERS: ("cycle", "name"),
+        TABLE_TASK_ACTION_TIMERS: ("cycle", "name", "ctx_key"),
+    }
+
     def __init__(self, pri_d=None, pub_d=None):
         self.pri_path = None
         if pri_d:
@@ -109,6 +119,17 @@ class SuiteDatabaseManager:
             self.TABLE_XTRIGGERS: [],
             self.TABLE_ABS_OUTPUTS: []}
         self.db_updates_map = {}
+        # Rows queued by the last call to put_task_pool:
+        # {table_name: {primary_key_values: row}}
+        # (None until the first call.)
+        self.db_task_pool_rows = None
+        # Submit numbers recorded in the task_states table, so that tasks can
+        # be spawned without querying the database:
+        # {point: {name: {flow_label: submit_num}}}
+        self.submit_nums = {}
+        # Cycle points before this one have been evicted from
+        # self.submit_nums, the database must be queried for them.
+        self.submit_nums_min_point = None
 
     def copy_pri_to_pub(self):
         """Copy content of primary database file to public database file.
@@ -359,6 +380,10 @@ class SuiteDatabaseManager:
         """Put statements to update the task_action_timers table."""
         if task_events_mgr.event_timers_updated:
             self.db_deletes_map[self.TABLE_TASK_ACTION_TIMERS].append({})
+            if self.db_task_pool_rows is not None:
+                # Task poll and retry timers must be re-inserted by the
+                # next put_task_pool.
+                self.db_task_pool_rows[self.TABLE_TASK_ACTION_TIMERS] = {}
             for key, timer in task_events_mgr._event_timers.items():
                 key1, point, name, submit_num = key
                 self.db_inserts_map[self.TABLE_TASK_ACTION_TIMERS].append({
@@ -405,58 +430,21 @@ class SuiteDatabaseManager:
     def put_task_pool(self, pool):
         """Update various task tables for current pool, in runtime database.
 
-        Queue delete (everything) statements to wipe the tables, and queue the
-        relevant insert statements for the current tasks in the pool.
+        Generate the rows of the task_pool, task_prerequisites,
+        task_timeout_timers and (task-owned) task_action_timers tables for
+        the current tasks in the pool, and compare them with the rows queued
+        by the previous call. Queue insert statements only for rows that are
+        new or changed, and delete statements only for rows that no longer
+        exist, so the database cost is proportional to what has changed
+        rather than to the size of the pool.
+
+        On the first call, queue delete (everything) statements to wipe the
+        tables (except task_action_timers, see put_task_event_timers) and
+        insert all rows, in case the database holds rows from a previous run.
         """
-        self.db_deletes_map[self.TABLE_TASK_POOL].append({})
-        self.db_deletes_map[self.TABLE_TASK_PREREQUISITES].append({})
-        # No need to do:
-        # self.db_deletes_map[self.TABLE_TASK_ACTION_TIMERS].append({})
-        # Should already be done by self.put_task_event_timers above.
-        self.db_deletes_map[self.TABLE_TASK_TIMEOUT_TIMERS].append({})
+        rows = {table_name: {} for table_name in self.TASK_POOL_TABLE_KEYS}
         for itask in pool.get_all_tasks():
-            # Update the task_prerequisites table:
-            for prereq in itask.state.prerequisites:
-                for (p_name, p_cycle, p_output), satisfied_state in (
-                        prereq.satisfied.items()):
-                    self.put_insert_task_prerequisites(itask, {
-                        "prereq_name": p_name,
-                        "prereq_cycle": p_cycle,
-                        "prereq_output": p_output,
-                        "satisfied": satisfied_state})
-            self.db_inserts_map[self.TABLE_TASK_POOL].append({
-                "name": itask.tdef.name,
-                "cycle": str(itask.point),
-                "flow_label": itask.flow_label,
-                "status": itask.state.status,
-                "is_held": itask.state.is_held})
-            if itask.timeout is not None:
-                self.db_inserts_map[self.TABLE_TASK_TIMEOUT_TIMERS].append({
-                    "name": itask.tdef.name,
-                    "cycle": str(itask.point),
-                    "timeout": itask.timeout})
-            if itask.poll_timer is not None:
-                self.db_inserts_map[self.TABLE_TASK_ACTION_TIMERS].append({
-                    "name": itask.tdef.name,
-                    "cycle": str(itask.point),
-                    "ctx_key": json.dumps("poll_timer"),
-                    "ctx": self._namedtuple2json(itask.poll_timer.ctx),
-                    "delays": json.dumps(itask.poll_timer.delays),
-                    "num": itask.poll_timer.num,
-                    "delay": itask.poll_timer.delay,
-                    "timeout": itask.poll_timer.timeout})
-            for ctx_key_1, timer in itask.try_timers.items():
-                if timer is None:
-                    continue
-                self.db_inserts_map[self.TABLE_TASK_ACTION_TIMERS].append({
-                    "name": itask.tdef.name,
-                    "cycle": str(itask.point),
-                    "ctx_key": json.dumps(("try_timers", ctx_key_1)),
-                    "ctx": self._namedtuple2json(timer.ctx),
-                    "delays": json.dumps(timer.delays),
-                    "num": timer.num,
-                    "delay": timer.delay,
-                    "timeout": timer.timeout})
+            self._get_task_pool_rows(itask, rows)
             if itask.state.time_updated:
                 set_args = {
                     "time_updated": itask.state.time_updated,
@@ -472,8 +460,155 @@ class SuiteDatabaseManager:
                 self.db_updates_map.setdefault(self.TABLE_TASK_STATES, [])
                 self.db_updates_map[self.TABLE_TASK_STATES].append(
                     (set_args, where_args))
+                self._put_submit_num(
+                    itask.point, itask.tdef.name, itask.flow_label,
+                    itask.submit_num)
                 itask.state.time_updated = None
 
+        prev_rows = self.db_task_pool_rows
+        if prev_rows is None:
+            self.db_deletes_map[self.TABLE_TASK_POOL].append({})
+            self.db_deletes_map[self.TABLE_TASK_PREREQUISITES].append({})
+            self.db_deletes_map[self.TABLE_TASK_TIMEOUT_TIMERS].append({})
+            prev_rows = {
+                table_name: {} for table_name in self.TASK_POOL_TABLE_KEYS}
+        for table_name, keys in self.TASK_POOL_TABLE_KEYS.items():
+            table_rows = rows[table_name]
+            prev_table_rows = prev_rows[table_name]
+            for key in prev_table_rows.keys() - table_rows.keys():
+                self.db_deletes_map[table_name].append(dict(zip(keys, key)))
+            for key, row in table_rows.items():
+                if prev_table_rows.get(key) != row:
+                    self.db_inserts_map[table_name].append(row)
+        self.db_task_pool_rows = rows
+
+    def _get_task_pool_rows(self, itask, rows):
+        """Add the task pool table rows of itask to rows.
+
+        Arguments:
+            itask (cylc.flow.task_proxy.TaskProxy): task proxy.
+            rows (dict): {table_name: {primary_key_values: row}}
+
+        """
+        name = itask.tdef.name
+        cycle = str(itask.point)
+        for prereq in itask.state.prerequisites:
+            for (p_name, p_cycle, p_output), satisfied_state in (
+                    prereq.satisfied.items()):
+                rows[self.TABLE_TASK_PREREQUISITES][
+                    (cycle, name, p_name, p_cycle, p_output)
+                ] = {
+                    "cycle": cycle,
+                    "name": name,
+                    "prereq_name": p_name,
+                    "prereq_cycle": p_cycle,
+                    "prereq_output": p_output,
+                    "satisfied": satisfied_state}
+        rows[self.TABLE_TASK_POOL][(cycle, name, itask.flow_label)] = {
+            "name": name,
+            "cycle": cycle,
+            "flow_label": itask.flow_label,
+            "status": itask.state.status,
+            "is_held": itask.state.is_held}
+        if itask.timeout is not None:
+            rows[self.TABLE_TASK_TIMEOUT_TIMERS][(cycle, name)] = {
+                "name": name,
+                "cycle": cycle,
+                "timeout": itask.timeout}
+        timers = [("poll_timer", itask.poll_timer)]
+        timers.extend(
+            (("try_timers", ctx_key_1), timer)
+            for ctx_key_1, timer in itask.try_timers.items())
+        for ctx_key, timer in timers:
+            if timer is None:
+                continue
+            ctx_key = json.dumps(ctx_key)
+            rows[self.TABLE_TASK_ACTION_TIMERS][(cycle, name, ctx_key)] = {
+                "name": name,
+                "cycle": cycle,
+                "ctx_key": ctx_key,
+                "ctx": self._namedtuple2json(timer.ctx),
+                "delays": json.dumps(timer.delays),
+                "num": timer.num,
+                "delay": timer.delay,
+                "timeout": timer.timeout}
+
+    def _put_submit_num(self, point, name, flow_label, submit_num):
+        """Record the submit number of name.point in flow_label."""
+        if (
+            self.submit_nums_min_point is not None
+            and point < self.submit_nums_min_point
+        ):
+            return
+        self.submit_nums.setdefault(point, {}).setdefault(name, {})[
+            flow_label] = submit_num
+
+    def load_submit_num_for_restart(self, row_idx, row):
+        """Load submit numbers from the task_states table on restart."""
+        name, cycle, flow_label, submit_num = row
+        self._put_submit_num(get_point(cycle), name, flow_label, submit_num)
+
+    def load_submit_nums_for_restart(self):
+        """Load submit numbers on restart.
+
+        Only load cycle points at or after the earliest point of the restart
+        task pool, which is no later than the runahead base point; earlier
+        points are queried from the database if ever needed.
+        """
+        pool_points = [
+            get_point(cycle)
+            for cycle in self.pri_dao.select_cycles(self.TABLE_TASK_POOL)]
+        if not pool_points:
+            self.pri_dao.select_submit_nums_for_restart(
+                self.load_submit_num_for_restart)
+            return
+        min_point = min(pool_points)
+        self.evict_submit_nums(min_point)
+        self.pri_dao.select_submit_nums_for_restart(
+            self.load_submit_num_for_restart,
+            [
+                cycle
+                for cycle in self.pri_dao.select_cycles(self.TABLE_TASK_STATES)
+                if get_point(cycle) >= min_point
+            ]
+        )
+
+    def get_submit_nums(self, name, point):
+        """Return submit numbers of name.point by flow label.
+
+        Return:
+        {
+            flow_label: submit_num,
+            ...,
+        }
+
+        Use the in-memory record if possible, else query the database.
+
+        Args:
+            name (str): task name
+            point (cylc.flow.cycling.PointBase): task cycle point
+        """
+        if (
+            self.submit_nums_min_point is not None
+            and point < self.submit_nums_min_point
+        ):
+            return self.pri_dao.select_submit_nums(name, str(point))
+        return dict(self.submit_nums.get(point, {}).get(name, {}))
+
+    def evict_submit_nums(self, point):
+        """Forget submit numbers of cycle points before point.
+
+        (They will be queried from the database if ever needed again.)
+        """
+        if (
+            self.submit_nums_min_point is not None
+            and point <= self.submit_nums_min_point
+        ):
+            return
+        self.submit_nums_min_point = point
+        for key in [key for key in self.submit_nums if key < point]:
+            del self.submit_nums[key]
+
     def put_insert_task_events(self, itask, args):
         """Put INSERT statement for task_events table."""
         self._put_insert_task_x(CylcSuiteDAO.TABLE_TASK_EVENTS, itask, args)
@@ -491,6 +626,9 @@ class SuiteDatabaseManager:
     def put_insert_task_states(self, itask, args):
         """Put INSERT statement for task_states table."""
         self._put_insert_task_x(CylcSuiteDAO.TABLE_TASK_STATES, itask, args)
+        self._put_submit_num(
+            itask.point, itask.tdef.name, args["flow_label"],
+            args["submit_num"])
 
     def put_insert_task_prerequisites(self, itask, args):
         """Put INSERT statement for task_prerequisites table."""
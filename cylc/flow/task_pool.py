@@ -57,6 +57,14 @@ from cylc.flow.wallclock import get_current_time_string
 from cylc.flow.platforms import get_platform
 
 
+# Task statuses that count towards internal queue limits.
+TASK_STATUSES_QUEUE_ACTIVE = frozenset([
+    TASK_STATUS_PREPARING,
+    TASK_STATUS_SUBMITTED,
+    TASK_STATUS_RUNNING,
+])
+
+
 class FlowLabelMgr:
     """
     Manage flow labels consisting of a string of one or more letters [a-zA-Z].
@@ -258,8 +266,8 @@ class TaskPool:
 
         # Any finished tasks can be released immediately (this can happen at
         # restart when all tasks are initially loaded into the runahead pool).
-        for itask_id_maps in self.runahead_pool.copy().values():
-            for itask in itask_id_maps.copy().values():
+        for itask_id_maps in list(self.runahead_pool.values()):
+            for itask in list(itask_id_maps.values()):
                 if itask.state(
                     TASK_STATUS_FAILED,
                     TASK_STATUS_SUCCEEDED,
@@ -268,28 +276,17 @@ class TaskPool:
                     self.release_runahead_task(itask)
                     released = True
 
-        points = []
-        for point, itasks in sorted(
-                self.get_tasks_by_point(incl_runahead=True).items()):
-            has_unfinished_itasks = False
-            for itask in itasks:
-                if not itask.state(
-                    TASK_STATUS_FAILED,
-                    TASK_STATUS_SUCCEEDED,
-                    TASK_STATUS_EXPIRED
-                ):
-                    has_unfinished_itasks = True
-                    break
-            if not points and not has_unfinished_itasks:
-                # We need to begin with an unfinished cycle point.
-                continue
-            points.append(point)
-
-        if not points:
+        # Get the earliest point with unfinished tasks. Only the tasks of
+        # leading finished points need be checked, not the whole pool.
+        points = sorted(set(self.pool).union(self.runahead_pool))
+        for ind, point in enumerate(points):
+            if self._point_has_unfinished_tasks(point):
+                points = points[ind:]
+                break
+        else:
             return False
-
-        # Get the earliest point with unfinished tasks.
-        runahead_base_point = min(points)
+        runahead_base_point = points[0]
+        self.suite_db_mgr.evict_submit_nums(runahead_base_point)
 
         if isinstance(self.custom_runahead_limit, IntegerInterval):
             number_limit = int(self.custom_runahead_limit)
@@ -323,12 +320,12 @@ class TaskPool:
             self._prev_runahead_sequence_points = sequence_points
             self._prev_runahead_base_point = runahead_base_point
 
-        points = set(points).union(sequence_points)
-
         if number_limit is not None:
             # Calculate which tasks to release based on a maximum number of
             # active cycle points (active meaning non-finished tasks).
-            latest_allowed_point = sorted(points)[:number_limit][-1]
+            points = sorted(set(points).union(sequence_points))
+            latest_allowed_point = points[
+                min(number_limit, len(points)) - 1]
             if self.max_future_offset is not None:
                 # For the first N points, release their future trigger tasks.
                 latest_allowed_point += self.max_future_offset
@@ -358,6 +355,21 @@ class TaskPool:
                     released = True
         return released
 
+    def _point_has_unfinished_tasks(self, point):
+        """Return True if any task at point is not finished."""
+        for itask_id_map in (
+            self.pool.get(point, {}),
+            self.runahead_pool.get(point, {})
+        ):
+            for itask in itask_id_map.values():
+                if not itask.state(
+                    TASK_STATUS_FAILED,
+                    TASK_STATUS_SUCCEEDED,
+                    TASK_STATUS_EXPIRED
+                ):
+                    return True
+        return False
+
     def load_abs_outputs_for_restart(self, row_idx, row):
         cycle, name, output = row
         self.abs_outputs_done.add((name, cycle, output))
@@ -432,8 +444,7 @@ class TaskPool:
                 sat[key] = satisfied if satisfied != '0' else False
 
             for itask_prereq in itask.state.prerequisites:
-                for key, _ in itask_prereq.satisfied.items():
-                    itask_prereq.satisfied[key] = sat[key]
+                itask_prereq.set_states(sat)
 
             itask.state.reset(status)
             self.add_to_runahead_pool(itask, is_new=False)
@@ -660,6 +671,17 @@ class TaskPool:
             except KeyError:
                 pass
 
+    def get_pool_task_by_id(self, id_):
+        """Return task by ID if in the main pool.
+
+        Return None if task does not exist.
+        """
+        for itask_ids in self.queues.values():
+            try:
+                return itask_ids[id_]
+            except KeyError:
+                pass
+
     def get_ready_tasks(self):
         """
         1) queue tasks that are ready to run (prerequisites satisfied,
@@ -684,50 +706,55 @@ class TaskPool:
         ready_tasks = []
         qconfig = self.config.cfg['scheduling']['queues']
 
-        for queue in self.queues:
-            # 1) queue unqueued tasks that are ready to run or manually forced
-            for itask in list(self.queues[queue].values()):
-                if not itask.state(TASK_STATUS_QUEUED):
-                    # only need to check that unqueued tasks are ready
-                    check_items = itask.is_ready()
-                    # use this periodic checking point for data-store delta
-                    # creation, some items aren't event driven (i.e. clock).
-                    if itask.tdef.clocktrigger_offset is not None:
-                        self.data_store_mgr.delta_task_clock_trigger(
-                            itask, check_items)
-                    if all(check_items):
-                        # queue the task
-                        itask.state.reset(TASK_STATUS_QUEUED)
-                        itask.reset_manual_trigger()
-                        # move the task to the back of the queue
-                        self.queues[queue][itask.identity] = \
-                            self.queues[queue].pop(itask.identity)
-                        self.data_store_mgr.delta_task_state(itask)
-
-            # 2) submit queued tasks if manually forced or not queue-limited
+        for queue, itask_id_map in self.queues.items():
+            # Sort the tasks of the queue in a single pass:
+            # * count active tasks (for the queue limit)
+            # * collect tasks already queued
+            # * queue unqueued tasks that are ready to run or manually forced
             n_active = 0
-            n_release = 0
-            n_limit = qconfig[queue]['limit']
-            tasks = list(self.queues[queue].values())
-
-            # 2.1) count active tasks and compare to queue limit
-            if n_limit:
-                for itask in tasks:
-                    if itask.state(
-                            TASK_STATUS_PREPARING,
-                            TASK_STATUS_SUBMITTED,
-                            TASK_STATUS_RUNNING,
-                            is_held=False
-                    ):
-                        n_active += 1
-                n_release = n_limit - n_active
-
-            # 2.2) release queued tasks if not limited or if manually forced
-            for itask in tasks:
-                if not itask.state(TASK_STATUS_QUEUED):
-                    # (Excludes tasks remaining TASK_STATUS_PREPARING because
-                    # job submission has been stopped with 'cylc shutdown').
+            queued = []
+            newly_queued = []
+            for itask in list(itask_id_map.values()):
+                status = itask.state.status
+                if status == TASK_STATUS_QUEUED:
+                    queued.append(itask)
+                    continue
+                if (
+                    status in TASK_STATUSES_QUEUE_ACTIVE
+                    and not itask.state.is_held
+                ):
+                    n_active += 1
+                if (
+                    status != TASK_STATUS_WAITING
+                    and not itask.manual_trigger
+                    and status not in itask.try_timers
+                    and itask.tdef.clocktrigger_offset is None
+                ):
+                    # not ready to run (see TaskProxy.is_ready)
                     continue
+                # only need to check that unqueued tasks are ready
+                check_items = itask.is_ready()
+                # use this periodic checking point for data-store delta
+                # creation, some items aren't event driven (i.e. clock).
+                if itask.tdef.clocktrigger_offset is not None:
+                    self.data_store_mgr.delta_task_clock_trigger(
+                        itask, check_items)
+                if all(check_items):
+                    # queue the task
+                    itask.state.reset(TASK_STATUS_QUEUED)
+                    itask.reset_manual_trigger()
+                    # move the task to the back of the queue
+                    itask_id_map[itask.identity] = itask_id_map.pop(
+                        itask.identity)
+                    newly_queued.append(itask)
+                    self.data_store_mgr.delta_task_state(itask)
+
+            # submit queued tasks if manually forced or not queue-limited
+            n_limit = qconfig[queue]['limit']
+            n_release = n_limit - n_active
+            for itask in queued + newly_queued:
+                # (Excludes tasks remaining TASK_STATUS_PREPARING because
+                # job submission has been stopped with 'cylc shutdown').
                 if itask.manual_trigger or not n_limit or n_release > 0:
                     # manual release, or no limit, or not currently limited
                     n_release -= 1
@@ -1083,14 +1110,15 @@ class TaskPool:
             # No children depend on this output
             children = []
 
-        suicide = []
+        output_id = (itask.tdef.name, str(itask.point), output)
+        if any(is_abs for _, _, is_abs in children):
+            self.abs_outputs_done.add(output_id)
+            self.suite_db_mgr.put_insert_abs_output(
+                str(itask.point), itask.tdef.name, output)
+
+        c_tasks = {}
+        abs_names = set()
         for c_name, c_point, is_abs in children:
-            if is_abs:
-                self.abs_outputs_done.add((itask.tdef.name,
-                                          str(itask.point), output))
-                self.suite_db_mgr.put_insert_abs_output(
-                    str(itask.point), itask.tdef.name, output)
-                self.suite_db_mgr.process_queued_ops()
             if itask.reflow:
                 c_task = self.get_or_spawn_task(
                     c_name, c_point, flow_label=itask.flow_label,
@@ -1098,23 +1126,33 @@ class TaskPool:
             else:
                 # Don't spawn, but update existing children.
                 c_task = self.get_task(c_name, c_point)
-
             if c_task is not None:
-                # Update downstream prerequisites directly.
+                c_tasks[c_task.identity] = c_task
                 if is_abs:
-                    tasks, _ = self.filter_task_proxies([c_name])
-                else:
-                    tasks = [c_task]
-                for t in tasks:
-                    t.state.satisfy_me(
-                        set([(itask.tdef.name, str(itask.point), output)]))
-                    self.data_store_mgr.delta_task_prerequisite(t)
-                # Event-driven suicide.
-                if (c_task.state.suicide_prerequisites and
-                        c_task.state.suicide_prerequisites_all_satisfied()):
-                    suicide.append(c_task)
-
-                # TODO event-driven submit: check if prereqs are satisfied now.
+                    abs_names.add(c_name)
+
+        # Update downstream prerequisites directly (for absolute triggers,
+        # every instance of the child in the pool).
+        satisfy_tasks = dict(c_tasks)
+        if abs_names:
+            for t in self.get_all_tasks():
+                if t.tdef.name in abs_names:
+                    satisfy_tasks[t.identity] = t
+        for t in satisfy_tasks.values():
+            t.state.satisfy_me({output_id})
+            self.data_store_mgr.delta_task_prerequisite(t)
+
+        # Event-driven suicide.
+        suicide = [
+            c_task
+            for c_task in c_tasks.values()
+            if (
+                c_task.state.suicide_prerequisites
+                and c_task.state.suicide_prerequisites_all_satisfied()
+            )
+        ]
+
+        # TODO event-driven submit: check if prereqs are satisfied now.
 
         for c_task in suicide:
             if c_task.state(
@@ -1195,7 +1233,7 @@ class TaskPool:
             return None
 
         # Get submit number by flow label {flow_label: submit_num, ...}
-        snums = self.suite_db_mgr.pri_dao.select_submit_nums(name, str(point))
+        snums = self.suite_db_mgr.get_submit_nums(name, point)
         try:
             submit_num = max(snums.values())
         except ValueError:
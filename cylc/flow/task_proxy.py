@@ -17,6 +17,7 @@
 """Provide a class to represent a task proxy in a running suite."""
 
 from collections import Counter
+from sys import intern
 from time import time
 
 from metomi.isodatetime.timezone import get_local_time_zone
@@ -190,7 +191,8 @@ class TaskProxy:
         self.flow_label = flow_label
         self.reflow = reflow
         self.point = start_point
-        self.identity = TaskID.get(self.tdef.name, self.point)
+        # (interned, so shared with self.state.identity)
+        self.identity = intern(TaskID.get(self.tdef.name, self.point))
 
         self.reload_successor = None
         self.point_as_seconds = None
@@ -16,6 +16,7 @@
 
 """Task state related logic."""
 
+from sys import intern
 
 from cylc.flow import LOG
 from cylc.flow.prerequisite import Prerequisite
@@ -226,7 +227,7 @@ class TaskState:
     ]
 
     def __init__(self, tdef, point, status, is_held):
-        self.identity = TaskID.get(tdef.name, str(point))
+        self.identity = intern(TaskID.get(tdef.name, str(point)))
         self.status = status
         self.is_held = is_held
         self.is_updated = False
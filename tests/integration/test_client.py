@@ -15,6 +15,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """Test cylc.flow.client.SuiteRuntimeClient."""
+import asyncio
+from threading import Event, Thread
+
 import pytest
 
 from cylc.flow.network.client import SuiteRuntimeClient
@@ -53,3 +56,42 @@ async def test_protobuf(harness):
     pb_data = PB_METHOD_MAP['pb_entire_workflow']()
     pb_data.ParseFromString(ret)
     assert schd.suite in pb_data.workflow.id
+
+
+@pytest.mark.asyncio
+async def test_concurrent(harness, monkeypatch):
+    """It should not hold up requests behind a slow one."""
+    schd, client = harness
+    started = Event()
+    release = Event()
+
+    def slow_api(**_):
+        started.set()
+        release.wait(10)
+        return 'slow'
+
+    monkeypatch.setattr(schd.server, 'api', slow_api, raising=False)
+    # (don't let the main loop wait for the slow request to apply deltas)
+    monkeypatch.setattr(schd.data_store_mgr, 'MAX_APPLY_DELAY', 60)
+    finished = []
+
+    def slow_request():
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        slow_client = SuiteRuntimeClient(schd.suite)
+        asyncio.get_event_loop().run_until_complete(
+            slow_client.async_request('api'))
+        finished.append('api')
+        slow_client.stop(stop_loop=False)
+
+    thread = Thread(target=slow_request)
+    thread.start()
+    # the slow request is being served
+    assert started.wait(10)
+    await client.async_request(
+        'graphql',
+        {'request_string': 'query { workflows { id } }'}
+    )
+    finished.append('graphql')
+    release.set()
+    thread.join()
+    assert finished == ['graphql', 'api']
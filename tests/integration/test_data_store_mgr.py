@@ -15,16 +15,19 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from copy import copy, deepcopy
+from collections import Counter
 import pytest
 
 from cylc.flow import ID_DELIM
 from cylc.flow.data_store_mgr import (
+    EDGES,
     FAMILY_PROXIES,
     JOBS,
     TASKS,
     TASK_PROXIES,
     WORKFLOW,
-    JOB_STATUSES_ALL
+    JOB_STATUSES_ALL,
+    generate_checksum,
 )
 from cylc.flow.task_state import (
     TASK_STATUS_FAILED,
@@ -149,6 +152,8 @@ def test_increment_graph_window(harness):
     schd, data = harness
     assert schd.data_store_mgr.prune_trigger_nodes
     assert len(data[TASK_PROXIES]) == 2
+    # graph relations memoised for the window nodes
+    assert set(schd.data_store_mgr.graph_relations) == set(data[TASK_PROXIES])
 
 
 def test_initiate_data_model(harness):
@@ -283,3 +288,112 @@ def test_delta_task_prerequisite(harness):
         p.satisfied
         for t in schd.data_store_mgr.updated[TASK_PROXIES].values()
         for p in t.prerequisites})
+
+
+@pytest.mark.asyncio
+async def test_apply_deltas_checksum(flow, scheduler, run):
+    """Test the incremental checksums match those of the whole store."""
+    reg = flow({
+        'scheduling': {
+            'graph': {
+                'R1': 'foo => bar'
+            }
+        }
+    })
+    schd = scheduler(reg)
+    async with run(schd):
+        data = schd.data_store_mgr.data[schd.data_store_mgr.workflow_id]
+        for itask in schd.pool.get_all_tasks():
+            itask.state.reset(TASK_STATUS_SUCCEEDED)
+            schd.data_store_mgr.delta_task_state(itask)
+        schd.data_store_mgr.update_data_structure()
+        for key, checksum in schd.data_store_mgr.checksums.items():
+            s_att = 'id' if key == EDGES else 'stamp'
+            assert checksum & 0xffffffff == generate_checksum(
+                getattr(element, s_att) for element in data[key].values()
+            )
+
+
+@pytest.mark.asyncio
+async def test_update_family_proxies(flow, scheduler):
+    """Test the incremental family totals match a count of the tasks."""
+    reg = flow({
+        'scheduling': {
+            'graph': {
+                'R1': 'a & b & c'
+            }
+        },
+        'runtime': {
+            'FAM': {},
+            'SUBFAM': {'inherit': 'FAM'},
+            'a': {'inherit': 'FAM'},
+            'b': {'inherit': 'SUBFAM'},
+            'c': {'inherit': 'SUBFAM'},
+        }
+    })
+    schd = scheduler(reg, hold_start=True)
+    await schd.install()
+    await schd.initialise()
+    await schd.configure()
+    schd.release_tasks()
+    schd.data_store_mgr.initiate_data_model()
+    data = schd.data_store_mgr.data[schd.data_store_mgr.workflow_id]
+    assert data[TASK_PROXIES]
+    for itask in schd.pool.get_all_tasks():
+        if itask.tdef.name == 'a':
+            itask.state.reset(TASK_STATUS_SUCCEEDED)
+        else:
+            itask.state.reset(TASK_STATUS_FAILED, is_held=True)
+        schd.data_store_mgr.delta_task_state(itask)
+        schd.data_store_mgr.delta_task_held(itask)
+    schd.data_store_mgr.update_data_structure()
+    for fp_id, fam_node in data[FAMILY_PROXIES].items():
+        tasks = [
+            t
+            for t in data[TASK_PROXIES].values()
+            if fp_id in t.ancestors
+        ]
+        assert dict(fam_node.state_totals) == Counter(
+            t.state for t in tasks)
+        assert fam_node.is_held_total == sum(t.is_held for t in tasks)
+    fam_node = next(
+        n for n in data[FAMILY_PROXIES].values() if n.name == 'SUBFAM')
+    assert dict(fam_node.state_totals) == {TASK_STATUS_FAILED: 2}
+    assert fam_node.is_held_total == 2
+
+
+@pytest.mark.asyncio
+async def test_get_nodes_by_states(flow, scheduler):
+    """Test the state index returns nodes in data-store order."""
+    reg = flow({
+        'scheduling': {
+            'graph': {
+                'R1': 'a & b & c & d'
+            }
+        }
+    })
+    schd = scheduler(reg, hold_start=True)
+    await schd.install()
+    await schd.initialise()
+    await schd.configure()
+    schd.release_tasks()
+    schd.data_store_mgr.initiate_data_model()
+    data = schd.data_store_mgr.data[schd.data_store_mgr.workflow_id]
+    states = [TASK_STATUS_SUCCEEDED, TASK_STATUS_FAILED]
+    for names in ('bd', 'abd'):
+        for itask in schd.pool.get_all_tasks():
+            if itask.tdef.name in names:
+                itask.state.reset(TASK_STATUS_FAILED)
+            else:
+                itask.state.reset(TASK_STATUS_SUCCEEDED)
+            schd.data_store_mgr.delta_task_state(itask)
+        schd.data_store_mgr.update_data_structure()
+        nodes = schd.data_store_mgr.get_nodes_by_states(TASK_PROXIES, states)
+        assert [n.id for n in nodes] == [
+            n.id for n in data[TASK_PROXIES].values() if n.state in states]
+        assert len(nodes) == 4
+    assert [
+        n.name
+        for n in schd.data_store_mgr.get_nodes_by_states(
+            TASK_PROXIES, [TASK_STATUS_FAILED])
+    ] == [n.name for n in data[TASK_PROXIES].values() if n.name in 'abd']
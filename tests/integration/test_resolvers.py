@@ -13,12 +13,13 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
 from cylc.flow.data_store_mgr import ID_DELIM, EDGES, TASK_PROXIES
-from cylc.flow.network.resolvers import Resolvers
+from cylc.flow.network.resolvers import BaseResolvers, Resolvers
 from cylc.flow.network.schema import parse_node_id
 
 
@@ -112,6 +113,39 @@ async def test_get_nodes_all(flow, node_args):
     assert len(nodes) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_nodes_all_by_state(flow, node_args):
+    """Test state filtering (via the data-store state index)."""
+    for states in (['waiting'], ['waiting', 'failed']):
+        node_args['ghosts'] = True
+        node_args['states'] = states
+        nodes = await flow.resolvers.get_nodes_all(TASK_PROXIES, node_args)
+        assert nodes
+        # (in data-store order)
+        assert [n.id for n in nodes] == [
+            n.id
+            for n in flow.data[TASK_PROXIES].values()
+            if n.state in states
+        ]
+
+
+@pytest.mark.asyncio
+async def test_get_filter_candidates_scan(flow, node_args):
+    """Test other workflows and stores without an index are scanned."""
+    node_args['states'] = ['waiting']
+    # another workflow (e.g. in a UI Server data store)
+    other_flow = {TASK_PROXIES: {'other': 'node'}}
+    assert list(flow.resolvers.get_filter_candidates(
+        other_flow, TASK_PROXIES, node_args)) == ['node']
+    # a data store manager without a state index
+    data_store_mgr = SimpleNamespace(
+        data={flow.id: flow.data}, workflow_id=flow.id)
+    resolvers = BaseResolvers(data_store_mgr)
+    assert list(resolvers.get_filter_candidates(
+        flow.data, TASK_PROXIES, node_args)) == list(
+            flow.data[TASK_PROXIES].values())
+
+
 @pytest.mark.asyncio
 async def test_get_nodes_by_ids(flow, node_args):
     """Test method returning workflow(s) node messages
@@ -20,7 +20,7 @@ from getpass import getuser
 
 import pytest
 
-from cylc.flow.network.server import PB_METHOD_MAP
+from cylc.flow.network.server import PB_METHOD_MAP, SuiteRuntimeServer
 
 
 @pytest.mark.asyncio
@@ -110,3 +110,27 @@ def test_receiver(accident):
     assert 'error' in accident.server._receiver(msg_in)
     msg_in = {'command': 'foobar', 'args': {}}
     assert 'error' in accident.server._receiver(msg_in)
+
+
+@pytest.mark.parametrize(
+    'request_string,expected',
+    [
+        ('mutation { stop(workflows: ["*"]) { result } }', True),
+        ('# comment\n  mutation { stop(workflows: ["*"]) { result } }', True),
+        (
+            'fragment f on Workflow { id }\n'
+            'mutation { stop(workflows: ["*"]) { result } }',
+            True
+        ),
+        ('query { workflows { id } }', False),
+        ('{ workflows { id } }', False),
+        ('# mutation\nquery { workflows { id } }', False),
+        ('mutation {', False),
+        (None, False),
+    ]
+)
+def test_is_quick(request_string, expected):
+    """Test mutations are told apart by the parsed operation type."""
+    assert SuiteRuntimeServer._is_quick({
+        'command': 'graphql', 'args': {'request_string': request_string}
+    }) is expected
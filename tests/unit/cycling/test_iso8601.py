@@ -528,6 +528,80 @@ class TestISO8601Sequence(unittest.TestCase):
             sequence.is_on_sequence(ISO8601Point('20100809T0005')))
 
 
+class TestISO8601SequenceWindow(unittest.TestCase):
+    """Contains unit tests for the ISO8601Sequence window of points."""
+
+    def setUp(self):
+        init(time_zone='Z')
+
+    def test_window(self):
+        """Test the window gives the same results as the recurrence."""
+        args = (
+            'PT6H!(20000102T06Z, 20000102T12Z)',
+            '20000101T00Z',
+            '20000103T00Z')
+        sequence = ISO8601Sequence(*args)
+        points = [ISO8601Point('20000101T00Z').standardise()]
+        for _ in range(60):
+            points.append(points[-1] + ISO8601Interval('PT1H'))
+        # forward, then backward
+        for point in points + points[::-1]:
+            for method in [
+                'is_on_sequence', 'get_next_point', 'get_prev_point'
+            ]:
+                self.assertEqual(
+                    str(getattr(sequence, method)(point)),
+                    str(getattr(ISO8601Sequence(*args), method)(point)))
+        self.assertTrue(sequence._cached_window_points)
+        self.assertLessEqual(
+            len(sequence._cached_window_points),
+            ISO8601Sequence._MAX_CACHED_POINTS)
+
+    def test_window_copies(self):
+        """Test the window does not hand out its cached points."""
+        sequence = ISO8601Sequence('PT6H', '20000101T00Z', '20000103T00Z')
+        point = ISO8601Point('20000101T06Z')
+        self.assertTrue(sequence.is_on_sequence(point))
+        next_point = sequence.get_next_point(point)
+        self.assertEqual(next_point, ISO8601Point('20000101T12Z'))
+        for cached in sequence._cached_window_points:
+            self.assertIsNot(cached, point)
+            self.assertIsNot(cached, next_point)
+            self.assertIsNot(cached, sequence.get_prev_point(next_point))
+
+
+class TestISO8601Point(unittest.TestCase):
+    """Contains unit tests for the ISO8601Point class."""
+
+    def setUp(self):
+        init(time_zone='Z')
+
+    def test_cmp(self):
+        """Test point comparisons match those of the date-times."""
+        points = [
+            ISO8601Point(value)
+            for value in [
+                '20100808T0000+05', '20100807T2000Z', '20100807T2200+03',
+                '20100808T0100+01', '20100808T0000Z', '20091231T2359-01',
+                '20100101T0000+00', '20100228T1800-06',
+            ]
+        ]
+        for point in points:
+            for other in points:
+                self.assertEqual(
+                    point.__cmp__(other),
+                    ISO8601Point._iso_point_cmp(point.value, other.value))
+                self.assertEqual(
+                    point < other,
+                    ISO8601Point._iso_point_cmp(
+                        point.value, other.value) == -1)
+        self.assertEqual(
+            [str(point) for point in sorted(points)],
+            ['20100101T0000+00', '20091231T2359-01', '20100228T1800-06',
+             '20100808T0000+05', '20100807T2200+03', '20100807T2000Z',
+             '20100808T0100+01', '20100808T0000Z'])
+
+
 class TestRelativeCyclePoint(unittest.TestCase):
     """Contains unit tests for cycle point relative to current time."""
 
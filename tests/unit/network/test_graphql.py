@@ -20,7 +20,10 @@ import pytest
 from graphql import parse
 
 from cylc.flow.data_messages_pb2 import PbTaskProxy, PbPrerequisite
-from cylc.flow.network.graphql import AstDocArguments, null_setter, NULL_VALUE
+from cylc.flow.network.graphql import (
+    AstDocArguments, CylcGraphQLBackend, null_setter, parse_and_validate,
+    NULL_VALUE
+)
 from cylc.flow.network.schema import schema
 
 
@@ -154,3 +157,25 @@ def test_null_setter(pre_result, expected_result):
     """Test the null setting of different data types/results."""
     post_result = null_setter(pre_result)
     assert post_result == expected_result
+
+
+def test_document_from_string_cache():
+    """Test request documents are parsed and validated once."""
+    parse_and_validate.cache_clear()
+    backend = CylcGraphQLBackend()
+    request_string = 'query { workflows { id } }'
+    documents = [
+        backend.document_from_string(schema, request_string)
+        for _ in range(3)
+    ]
+    assert documents[0].document_ast is documents[2].document_ast
+    cache_info = parse_and_validate.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 2)
+
+    # validation errors are cached and reported too
+    for _ in range(2):
+        result = backend.document_from_string(
+            schema, 'query { foo }').execute(variable_values={})
+        assert result.invalid
+        assert 'Cannot query field "foo"' in str(result.errors[0])
+    assert parse_and_validate.cache_info().hits == 3
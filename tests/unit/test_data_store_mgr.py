@@ -14,7 +14,14 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from cylc.flow.data_store_mgr import task_mean_elapsed_time, parse_job_item
+from collections import Counter
+from threading import Event, Thread
+from time import sleep
+
+from cylc.flow.data_messages_pb2 import AllDeltas, PbTaskProxy
+from cylc.flow.data_store_mgr import (
+    DataStoreMgr, DELTAS_MAP, TASK_PROXIES, WORKFLOW, ReadWriteLock,
+    generate_checksum, task_mean_elapsed_time, parse_job_item)
 
 
 def int_id():
@@ -46,3 +53,94 @@ def test_parse_job_item():
     assert name, None == (point, (tpoint, tname, tsub_num))
     tpoint, tname, tsub_num = parse_job_item(f'{name}')
     assert name, None == (None, (tpoint, tname, tsub_num))
+
+
+def test_generate_checksum():
+    """Test the checksum is independent of order and can be built up."""
+    stamps = [f'foo.{point}@{point}.0' for point in range(10)]
+    assert generate_checksum(stamps) == generate_checksum(reversed(stamps))
+    assert generate_checksum(stamps) != generate_checksum(stamps[1:])
+    assert generate_checksum(stamps) == (
+        generate_checksum(stamps[:5]) + generate_checksum(stamps[5:])
+    ) & 0xffffffff
+
+
+def test_get_publish_deltas():
+    """Test deltas are serialised once for both topic and all-deltas."""
+    data_store_mgr = DataStoreMgr.__new__(DataStoreMgr)
+    data_store_mgr.deltas = {
+        key: DELTAS_MAP[key]() for key in (TASK_PROXIES, WORKFLOW)}
+    tp_delta = data_store_mgr.deltas[TASK_PROXIES]
+    tp_delta.time = 1.0
+    tp_delta.checksum = 123
+    # large enough for a multi-byte length
+    tp_delta.added.extend(
+        PbTaskProxy(id=f'foo.{point}', state='waiting') for point in range(99)
+    )
+    tp_delta.pruned.append('foo.0')
+    expected = AllDeltas()
+    expected.task_proxies.CopyFrom(tp_delta)
+
+    result = data_store_mgr.get_publish_deltas()
+    assert result[0] == (b'task_proxies', tp_delta.SerializeToString())
+    assert [topic for topic, _ in result] == [b'task_proxies', b'all']
+    all_deltas = AllDeltas()
+    all_deltas.ParseFromString(result[-1][1])
+    assert all_deltas == expected
+
+
+def test_adjust_family_totals_pruned():
+    """Test a task leaving a pruned family does not resurrect its totals."""
+    data_store_mgr = DataStoreMgr.__new__(DataStoreMgr)
+    data_store_mgr.family_task_totals = {}
+    data_store_mgr.family_state_totals = {}
+    data_store_mgr.family_held_totals = {}
+    data_store_mgr.state_update_families = set()
+    data_store_mgr._adjust_family_totals('foo.1', 'waiting', True, ['FAM.1'])
+    assert data_store_mgr.family_state_totals == {
+        'FAM.1': Counter({'waiting': 1})}
+    assert data_store_mgr.family_held_totals == {'FAM.1': 1}
+
+    # the family is pruned before the task
+    data_store_mgr.family_state_totals.pop('FAM.1')
+    data_store_mgr.family_held_totals.pop('FAM.1')
+    data_store_mgr._adjust_family_totals('foo.1', None, False, [])
+    assert data_store_mgr.family_task_totals == {}
+    assert data_store_mgr.family_state_totals == {}
+    assert data_store_mgr.family_held_totals == {}
+
+
+def test_read_write_lock():
+    """Test a writer waits for readers, and holds up new readers."""
+    lock = ReadWriteLock()
+    events = []
+    reading = Event()
+    release = Event()
+
+    def read(name, wait=False):
+        with lock.read():
+            reading.set()
+            if wait:
+                release.wait()
+            events.append(name)
+
+    def write():
+        with lock.write():
+            events.append('write')
+
+    threads = [Thread(target=read, args=('read1', True))]
+    threads[0].start()
+    reading.wait()
+    assert not lock.acquire_write(blocking=False)
+    threads.append(Thread(target=write))
+    threads[1].start()
+    while not lock._writers_waiting:
+        sleep(0.001)
+    threads.append(Thread(target=read, args=('read2',)))
+    threads[2].start()
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert events == ['read1', 'write', 'read2']
+    assert lock.acquire_write(blocking=False)
+    lock.release_write()
@@ -25,6 +25,7 @@ from unittest import mock
 
 from cylc.flow import __version__
 import cylc.flow.flags
+from cylc.flow import job_file
 from cylc.flow.job_file import JobFileWriter
 from cylc.flow.platforms import platform_from_name
 
@@ -513,3 +514,113 @@ def test_write_global_init_scripts(fixture_get_platform):
     with io.StringIO() as fake_file:
         JobFileWriter()._write_global_init_script(fake_file, job_conf)
         assert(fake_file.getvalue() == expected)
+
+
+@mock.patch.dict(
+    "os.environ", {'CYLC_SUITE_DEF_PATH': 'cylc/suite/def/path'})
+@mock.patch("cylc.flow.job_file.get_remote_suite_run_dir")
+def test_write_syntax_check_once(
+    mocked_get_remote_suite_run_dir, fixture_get_platform, tmp_path
+):
+    """Test the syntax check is done once per distinct user script."""
+    mocked_get_remote_suite_run_dir.return_value = "run/dir"
+    writer = JobFileWriter()
+
+    def write(task_id, script, work_d=None):
+        job_conf = {
+            "platform": fixture_get_platform(),
+            "task_id": task_id,
+            "suite_name": "farm_noises",
+            "work_d": work_d,
+            "remote_suite_d": "remote/suite/dir",
+            "uuid_str": "neigh",
+            "environment": {},
+            "job_d": f"1/{task_id}/01",
+            "try_num": 1,
+            "flow_label": "aZ",
+            "param_var": {},
+            "execution_time_limit": None,
+            "namespace_hierarchy": ["root", task_id],
+            "dependencies": [],
+            "init-script": None,
+            "env-script": None,
+            "err-script": None,
+            "pre-script": None,
+            "script": script,
+            "post-script": None,
+            "exit-script": None,
+        }
+        writer.write(str(tmp_path / task_id), job_conf)
+
+    with mock.patch(
+        "cylc.flow.job_file.Popen", wraps=job_file.Popen
+    ) as mocked_popen:
+        write('baa', 'echo baa')
+        write('moo', 'echo baa')
+        assert mocked_popen.call_count == 1
+        write('oink', 'echo oink')
+        assert mocked_popen.call_count == 2
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                write('quack', 'if then')
+        assert mocked_popen.call_count == 4
+        # user defined task environment values are checked too
+        with pytest.raises(RuntimeError):
+            write('quack', 'echo oink', work_d="it's")
+        assert mocked_popen.call_count == 5
+    assert (tmp_path / 'moo').exists()
+
+
+@mock.patch.dict(
+    "os.environ", {'CYLC_SUITE_DEF_PATH': 'cylc/suite/def/path'})
+@mock.patch("cylc.flow.job_file.get_remote_suite_run_dir")
+def test_write_syntax_check_once_slurm(
+    mocked_get_remote_suite_run_dir, fixture_get_platform, tmp_path
+):
+    """Test jobs with different job runner directives share a check."""
+    mocked_get_remote_suite_run_dir.return_value = "run/dir"
+    writer = JobFileWriter()
+
+    def write(task_id, directives):
+        job_file_path = str(tmp_path / task_id)
+        job_conf = {
+            "platform": fixture_get_platform({"job runner": "slurm"}),
+            "task_id": task_id,
+            "suite_name": "farm_noises",
+            "work_d": None,
+            "remote_suite_d": "remote/suite/dir",
+            "uuid_str": "neigh",
+            "environment": {},
+            "job_d": f"1/{task_id}/01",
+            "job_file_path": job_file_path,
+            "directives": directives,
+            "try_num": 1,
+            "flow_label": "aZ",
+            "param_var": {},
+            "execution_time_limit": None,
+            "namespace_hierarchy": ["root", task_id],
+            "dependencies": [],
+            "init-script": None,
+            "env-script": None,
+            "err-script": None,
+            "pre-script": None,
+            "script": "echo baa",
+            "post-script": None,
+            "exit-script": None,
+        }
+        writer.write(job_file_path, job_conf)
+        return (tmp_path / task_id).read_text()
+
+    with mock.patch(
+        "cylc.flow.job_file.Popen", wraps=job_file.Popen
+    ) as mocked_popen:
+        assert '#SBATCH --job-name=baa.farm_noises' in write(
+            'baa', {'--mem': '1G'})
+        assert '#SBATCH --job-name=moo.farm_noises' in write(
+            'moo', {'--mem': '1G'})
+        assert mocked_popen.call_count == 1
+        # user defined directive values are checked
+        with pytest.raises(RuntimeError):
+            write('oink', {'--mem': '1G\nif then'})
+        assert mocked_popen.call_count == 2
+    assert not (tmp_path / 'quack').exists()
@@ -0,0 +1,135 @@
+# THIS FILE IS PART OF THE CYLC SUITE ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import re
+
+import pytest
+
+from cylc.flow.job_runner_mgr import JobRunnerManager
+
+
+class OneHandler:
+    """Job runner handler which submits one job at a time."""
+
+    REC_ID_FROM_SUBMIT_OUT = re.compile(r'\A(?P<id>\d+)\Z')
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, job_file_path, submit_opts):
+        self.submitted.append(job_file_path)
+        # job ID from the task name, e.g. 97 for "1/a/01/job"
+        return 0, f'{ord(job_file_path.split(os.sep)[-3])}\n', ''
+
+
+class ManyHandler(OneHandler):
+    """Job runner handler which submits jobs in bulk."""
+
+    def submit_many(self, jobs):
+        self.submitted.append([job_file_path for job_file_path, _ in jobs])
+        return [
+            (0, f'{100 + index}\n', '')
+            for index, _ in enumerate(jobs)
+        ]
+
+
+@pytest.fixture
+def job_log_root(tmp_path):
+    """Return a job log root containing job files for some handlers."""
+    job_log_root = tmp_path / 'log' / 'job'
+    for name, handler in [
+        ('a', 'one'), ('b', 'many'), ('c', 'one'), ('d', 'many'), ('e', None),
+        ('f', 'background'),
+    ]:
+        job_log_dir = job_log_root / '1' / name / '01'
+        job_log_dir.mkdir(parents=True)
+        lines = []
+        if handler:
+            lines.append(
+                JobRunnerManager.LINE_PREFIX_JOB_RUNNER_NAME + handler)
+        (job_log_dir / 'job').write_text(''.join(
+            f'{line}\n' for line in lines))
+    return job_log_root
+
+
+def test_jobs_submit(job_log_root, monkeypatch, capsys):
+    """Test jobs are submitted in bulk or one by one by handler."""
+    one, many = OneHandler(), ManyHandler()
+    monkeypatch.setitem(JobRunnerManager._INSTANCES, 'one', one)
+    monkeypatch.setitem(JobRunnerManager._INSTANCES, 'many', many)
+    JobRunnerManager(env=[]).jobs_submit(
+        str(job_log_root), [f'1/{name}/01' for name in 'abcdef'])
+    assert sorted(one.submitted) == [
+        str(job_log_root / '1' / name / '01' / 'job') for name in 'ac']
+    assert many.submitted == [[
+        str(job_log_root / '1' / name / '01' / 'job') for name in 'bd']]
+    summary = {
+        line.split('|')[1]: line.split('|')[2:]
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith(JobRunnerManager.OUT_PREFIX_SUMMARY)
+    }
+    # reported in input order, whatever the order of submission
+    assert list(summary) == [f'1/{name}/01' for name in 'abcdef']
+    assert summary['1/b/01'] == ['0', '100']
+    assert summary['1/d/01'] == ['0', '101']
+    assert summary['1/a/01'] == ['0', '97']
+    assert summary['1/c/01'] == ['0', '99']
+    assert summary['1/e/01'] == ['1', '']
+    # (job file not executable)
+    assert summary['1/f/01'] == ['1', 'None']
+    status = (job_log_root / '1' / 'd' / '01' / 'job.status').read_text()
+    assert 'CYLC_JOB_RUNNER_NAME=many\n' in status
+    assert 'CYLC_JOB_ID=101\n' in status
+
+
+class PollHandler:
+    """Job runner handler which reports even job IDs as still queued."""
+
+    @staticmethod
+    def get_poll_many_cmd(job_ids):
+        return ['printf', r'JOBID STATE\n%s R\n'] + [
+            job_id for job_id in job_ids if int(job_id) % 2 == 0]
+
+
+def test_jobs_poll(tmp_path, monkeypatch, capsys):
+    """Test polled jobs are matched against the poll command output."""
+    monkeypatch.setitem(JobRunnerManager._INSTANCES, 'poll', PollHandler())
+    job_log_dirs = []
+    for job_id in range(1000):
+        job_log_dir = f'1/t{job_id}/01'
+        (tmp_path / job_log_dir).mkdir(parents=True)
+        (tmp_path / job_log_dir / 'job.status').write_text(
+            f'{JobRunnerManager.CYLC_JOB_RUNNER_NAME}=poll\n'
+            f'{JobRunnerManager.CYLC_JOB_ID}={job_id}\n'
+        )
+        job_log_dirs.append(job_log_dir)
+    JobRunnerManager().jobs_poll(str(tmp_path), job_log_dirs)
+    exit_polled = {}
+    for line in capsys.readouterr().out.splitlines():
+        if line.startswith(JobRunnerManager.OUT_PREFIX_SUMMARY):
+            ctx = json.loads(line.split('|', 2)[2])
+            exit_polled[int(ctx['job_id'])] = ctx['job_runner_exit_polled']
+    assert exit_polled == {job_id: job_id % 2 for job_id in range(1000)}
+    assert (
+        JobRunnerManager.CYLC_JOB_RUNNER_EXIT_POLLED
+        in (tmp_path / '1/t1/01/job.status').read_text()
+    )
+    assert (
+        JobRunnerManager.CYLC_JOB_RUNNER_EXIT_POLLED
+        not in (tmp_path / '1/t0/01/job.status').read_text()
+    )
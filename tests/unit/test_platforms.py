@@ -17,6 +17,7 @@
 # Tests for the platform lookup.
 
 import pytest
+from cylc.flow import platforms as platforms_module
 from cylc.flow.parsec.OrderedDict import OrderedDictWithDefaults
 from cylc.flow.platforms import (
     platform_from_name, platform_from_job_info,
@@ -414,3 +415,45 @@ def test_get_install_target_to_platforms_map(
                 _map[install_target] = sorted(_map[install_target],
                                               key=lambda k: k['name'])
         assert result == expected_map
+
+
+def test_platform_from_name_cache(mock_glbl_cfg, monkeypatch):
+    """Test platforms are resolved once per global config, and copied."""
+    calls = []
+    orig_platform_from_re = platforms_module._platform_from_re
+
+    def _platform_from_re(platform_name, platforms):
+        calls.append(platform_name)
+        return orig_platform_from_re(platform_name, platforms)
+
+    monkeypatch.setattr(
+        'cylc.flow.platforms._platform_from_re', _platform_from_re)
+    mock_glbl_cfg(
+        'cylc.flow.platforms.glbl_cfg',
+        '''
+        [platforms]
+            [[saffron\\d\\d]]
+                job runner = slurm
+        '''
+    )
+    platform = platform_from_name('saffron01')
+    assert platform['hosts'] == ['saffron01']
+    assert platform['job runner'] == 'slurm'
+    platform['hosts'].append('saffron02')
+    platform['job runner'] = 'pbs'
+    platform = platform_from_name('saffron01')
+    assert platform['hosts'] == ['saffron01']
+    assert platform['job runner'] == 'slurm'
+    assert calls == ['saffron01']
+
+    # a new global config invalidates the cache
+    mock_glbl_cfg(
+        'cylc.flow.platforms.glbl_cfg',
+        '''
+        [platforms]
+            [[saffron\\d\\d]]
+                job runner = pbs
+        '''
+    )
+    assert platform_from_name('saffron01')['job runner'] == 'pbs'
+    assert calls == ['saffron01', 'saffron01']
@@ -0,0 +1,135 @@
+# THIS FILE IS PART OF THE CYLC SUITE ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from cylc.flow.cycling.integer import IntegerPoint
+from cylc.flow.prerequisite import Prerequisite, _compile_condition
+
+
+def make_prereq(point, expr, messages):
+    prereq = Prerequisite(IntegerPoint(point))
+    for message in messages:
+        prereq.add(*message)
+    prereq.set_condition(expr)
+    return prereq
+
+
+@pytest.fixture
+def wide_or():
+    """Return a function to make an "a0 | a1 | a2 ..." prerequisite."""
+    def _wide_or(point, width=10):
+        messages = [(f'a{ind}', point, 'succeeded') for ind in range(width)]
+        expr = '|'.join(
+            Prerequisite.MESSAGE_TEMPLATE % message for message in messages)
+        return make_prereq(point, expr, messages)
+    return _wide_or
+
+
+def test_conditional(wide_or):
+    """Test the evaluation of a conditional prerequisite."""
+    prereq = wide_or(1)
+    assert prereq.conditional_expression == '|'.join(
+        f'bool(satisfied[{ind}])' for ind in range(10))
+    assert prereq.get_raw_conditional_expression() == '|'.join(
+        f'a{ind}.1 succeeded' for ind in range(10))
+    assert not prereq.is_satisfied()
+    assert prereq.satisfy_me({('b', '1', 'succeeded')}) == set()
+    assert not prereq.is_satisfied()
+    assert prereq.satisfy_me({('a9', '1', 'succeeded')}) == {
+        ('a9', '1', 'succeeded')}
+    assert prereq.is_satisfied()
+    prereq.set_not_satisfied()
+    assert not prereq.is_satisfied()
+    prereq.set_satisfied()
+    assert prereq.is_satisfied()
+
+
+def test_conditional_and():
+    """Test a conditional prerequisite with both "&" and "|"."""
+    messages = [
+        ('a', '1', 'succeeded'), ('b', '1', 'succeeded'), ('c', '1', 'failed')]
+    prereq = make_prereq(
+        1, '(a.1 succeeded & b.1 succeeded) | c.1 failed', messages)
+    prereq.satisfy_me({messages[0]})
+    assert not prereq.is_satisfied()
+    prereq.satisfy_me({messages[1]})
+    assert prereq.is_satisfied()
+    prereq.set_not_satisfied()
+    prereq.satisfy_me({messages[2]})
+    assert prereq.is_satisfied()
+
+
+def test_conditional_shared(wide_or):
+    """Conditions are compiled once and shared between cycle points."""
+    _compile_condition.cache_clear()
+    prereqs = [wide_or(point) for point in range(1, 11)]
+    for prereq in prereqs:
+        prereq.satisfy_me({('a1', str(prereq.point), 'succeeded')})
+        assert prereq.is_satisfied()
+    assert _compile_condition.cache_info().misses == 1
+    assert _compile_condition.cache_info().hits == 9
+
+
+def test_shared_strings(wide_or):
+    """Test the point strings and expressions are shared by instances."""
+    prereq_1 = wide_or(10)
+    prereq_2 = wide_or(10)
+    assert prereq_1.target_point_strings[0] is (
+        prereq_2.target_point_strings[0])
+    for message_1, message_2 in zip(prereq_1.satisfied, prereq_2.satisfied):
+        assert message_1[1] is message_2[1]
+    assert prereq_1.conditional_expression is (
+        prereq_2.conditional_expression)
+
+
+def test_message_states():
+    """Test message states are kept in bit arrays behind the mapping."""
+    messages = [
+        ('a', '1', 'succeeded'), ('b', '1', 'succeeded'), ('c', '1', 'failed')]
+    prereq = make_prereq(1, 'a.1 succeeded & b.1 succeeded & c.1 failed',
+                         messages)
+    assert prereq.messages == tuple(messages)
+    # no index dict is held once built
+    assert prereq._indexes is None
+    assert dict(prereq.satisfied) == dict.fromkeys(
+        messages, Prerequisite.DEP_STATE_UNSATISFIED)
+    prereq.satisfy_me({messages[1]})
+    prereq.satisfied[messages[2]] = Prerequisite.DEP_STATE_OVERRIDDEN
+    assert (prereq._satisfied_bits, prereq._overridden_bits) == (0b110, 0b100)
+    assert prereq.satisfied[messages[1]] == (
+        Prerequisite.DEP_STATE_SATISFIED)
+    assert prereq.get_resolved_dependencies() == ['b.1']
+    prereq.set_satisfied()
+    assert prereq.is_satisfied()
+    assert (prereq._satisfied_bits, prereq._overridden_bits) == (0b111, 0b101)
+    del prereq.satisfied[messages[0]]
+    assert prereq.messages == tuple(messages[1:])
+    assert (prereq._satisfied_bits, prereq._overridden_bits) == (0b11, 0b10)
+    with pytest.raises(KeyError):
+        prereq.satisfied[messages[0]] = Prerequisite.DEP_STATE_SATISFIED
+    assert messages[0] not in prereq.satisfied
+
+
+def test_set_states(wide_or):
+    """Test setting message states in bulk, e.g. on restart."""
+    prereq = wide_or(1, width=1000)
+    states = dict.fromkeys(prereq.messages, Prerequisite.DEP_STATE_UNSATISFIED)
+    states[('a500', '1', 'succeeded')] = Prerequisite.DEP_STATE_SATISFIED
+    prereq.set_states(states)
+    assert prereq.is_satisfied()
+    assert prereq._satisfied_bits == 1 << 500
+    assert prereq.satisfied.items() == list(states.items())
@@ -15,7 +15,10 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Test the cylc.flow.remote module."""
 
-from cylc.flow.remote import run_cmd
+import shlex
+
+from cylc.flow.remote import (
+    run_cmd, construct_rsync_over_ssh_cmd, _construct_ssh_cmd)
 
 
 def test_run_cmd_stdin_str():
@@ -46,3 +49,48 @@ def test_run_cmd_stdin_file(tmp_path):
         b'1bar2',
         b''
     ]
+
+
+def test_construct_ssh_cmd_persist(monkeypatch, tmp_path):
+    """Test SSH connection sharing options are added if configured."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    kwargs = {
+        'host': 'remote',
+        'ssh_cmd': 'ssh -oBatchMode=yes',
+        'ssh_cylc': 'cylc',
+        'ssh_login_shell': False,
+    }
+    assert _construct_ssh_cmd(['foo'], **kwargs)[:3] == [
+        'ssh', '-oBatchMode=yes', 'remote']
+    assert _construct_ssh_cmd(['foo'], ssh_persist=300.0, **kwargs)[:6] == [
+        'ssh',
+        '-oBatchMode=yes',
+        '-oControlMaster=auto',
+        f'-oControlPath={tmp_path}/.cylc/ssh/%C',
+        '-oControlPersist=300',
+        'remote',
+    ]
+    assert (tmp_path / '.cylc' / 'ssh').stat().st_mode & 0o777 == 0o700
+
+
+def test_construct_rsync_over_ssh_cmd_persist(monkeypatch, tmp_path):
+    """Test SSH connection sharing options are quoted for rsync."""
+    home = tmp_path / 'my home'
+    monkeypatch.setenv('HOME', str(home))
+    platform = {
+        'hosts': ['remote'],
+        'ssh command': 'ssh -oBatchMode=yes',
+        'ssh connection persist': 300.0,
+    }
+    rsh = [
+        opt for opt in construct_rsync_over_ssh_cmd('/src', '/dst', platform)
+        if opt.startswith('--rsh=')
+    ][0]
+    assert shlex.split(rsh[len('--rsh='):]) == [
+        'ssh',
+        '-oBatchMode=yes',
+        '-oControlMaster=auto',
+        f'-oControlPath={home}/.cylc/ssh/%C',
+        '-oControlPersist=300',
+    ]
+    assert (home / '.cylc' / 'ssh').is_dir()
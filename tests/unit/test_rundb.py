@@ -22,6 +22,8 @@ import unittest
 from tempfile import mktemp
 from unittest import mock
 
+import pytest
+
 from cylc.flow.rundb import CylcSuiteDAO
 
 
@@ -126,5 +128,96 @@ def test_remove_columns():
         assert data == [('PUB',)]
 
 
+def test_execute_queued_items_connection():
+    """The private database connection persists unless the file goes."""
+    with create_temp_db() as (temp_db, conn):
+        conn.close()
+        dao = CylcSuiteDAO(temp_db)
+        dao.add_insert_item(
+            CylcSuiteDAO.TABLE_SUITE_PARAMS, {'key': 'a', 'value': '1'})
+        dao.execute_queued_items()
+        pri_conn = dao.conn
+        assert pri_conn is not None
+        dao.add_insert_item(
+            CylcSuiteDAO.TABLE_SUITE_PARAMS, {'key': 'b', 'value': '2'})
+        dao.execute_queued_items()
+        assert dao.conn is pri_conn
+
+        # the public database connection is closed after each call
+        pub_dao = CylcSuiteDAO(temp_db, is_public=True)
+        pub_dao.add_insert_item(
+            CylcSuiteDAO.TABLE_SUITE_PARAMS, {'key': 'c', 'value': '3'})
+        pub_dao.execute_queued_items()
+        assert pub_dao.n_tries == 0
+        assert pub_dao.conn is None
+
+        # the database file is removed, the reconnection creates a new file
+        # without the tables
+        os.remove(temp_db)
+        dao.add_insert_item(
+            CylcSuiteDAO.TABLE_SUITE_PARAMS, {'key': 'd', 'value': '4'})
+        with pytest.raises(sqlite3.OperationalError):
+            dao.execute_queued_items()
+        assert dao.conn is not pri_conn
+        dao.close()
+
+
+def test_execute_queued_items_error():
+    """A failed private database batch is not committed later."""
+    with create_temp_db() as (temp_db, conn):
+        dao = CylcSuiteDAO(temp_db)
+        dao.add_insert_item(
+            CylcSuiteDAO.TABLE_SUITE_PARAMS, {'key': 'a', 'value': '1'})
+        dao.execute_queued_items()
+        conn.execute(
+            r'''
+                CREATE TRIGGER fail BEFORE INSERT ON suite_params
+                WHEN NEW.key = 'bad'
+                BEGIN SELECT RAISE(ABORT, 'bad key'); END
+            '''
+        )
+        conn.commit()
+        # the first row of the batch is written before the second fails
+        for key in ['b', 'bad']:
+            dao.add_insert_item(
+                CylcSuiteDAO.TABLE_SUITE_PARAMS, {'key': key, 'value': '2'})
+        with pytest.raises(sqlite3.IntegrityError):
+            dao.execute_queued_items()
+        # nothing from the batch is committed, and nothing is locked
+        conn.execute('DROP TRIGGER fail')
+        conn.commit()
+        assert list(conn.execute('SELECT key FROM suite_params')) == [('a',)]
+        dao.close()
+
+
+def test_select_submit_nums_for_restart(monkeypatch):
+    """Submit numbers can be selected for given cycle points only."""
+    monkeypatch.setattr(CylcSuiteDAO, 'MAX_HOST_PARAMS', 2)
+    with create_temp_db() as (temp_db, conn):
+        dao = CylcSuiteDAO(temp_db)
+        for cycle in ['1', '2', '3', '10']:
+            dao.add_insert_item(
+                CylcSuiteDAO.TABLE_TASK_STATES,
+                {'name': 'foo', 'cycle': cycle, 'flow_label': 'a',
+                 'submit_num': 1})
+        dao.execute_queued_items()
+        assert dao.select_cycles(CylcSuiteDAO.TABLE_TASK_STATES) == {
+            '1', '2', '3', '10'}
+
+        rows = []
+        dao.select_submit_nums_for_restart(
+            lambda row_idx, row: rows.append((row_idx, row)))
+        assert len(rows) == 4
+
+        # more cycles than host parameters per statement
+        rows = []
+        dao.select_submit_nums_for_restart(
+            lambda row_idx, row: rows.append((row_idx, row)),
+            ['2', '3', '10'])
+        assert [row_idx for row_idx, _ in rows] == [0, 1, 2]
+        assert sorted(row[1] for _, row in rows) == ['10', '2', '3']
+        dao.close()
+
+
 if __name__ == '__main__':
     unittest.main()
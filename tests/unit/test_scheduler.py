@@ -15,12 +15,15 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Tests for Cylc scheduler server."""
 
+import asyncio
 import pytest
 
+from threading import Timer
+from time import time
 from types import SimpleNamespace
 from unittest.mock import patch, create_autospec
 
-from cylc.flow.scheduler import Scheduler
+from cylc.flow.scheduler import Scheduler, SchedulerQueue
 
 
 @pytest.mark.parametrize(
@@ -107,3 +110,54 @@ def test_process_cylc_stop_point(get_point, options, expected):
 
     scheduler.process_cylc_stop_point(scheduler)
     assert scheduler.options.stopcp == expected
+
+
+@pytest.mark.asyncio
+async def test_main_loop_wakeup():
+    """Putting an item in a scheduler queue wakes up the main loop sleep."""
+    scheduler = create_autospec(Scheduler)
+    scheduler.main_loop_event_loop = asyncio.get_event_loop()
+    scheduler.main_loop_wakeup = asyncio.Event()
+    scheduler.message_queue = SchedulerQueue(
+        lambda: Scheduler.wakeup(scheduler))
+
+    # from another thread
+    thread = Timer(0.1, scheduler.message_queue.put, ['foo'])
+    thread.start()
+    start = time()
+    await Scheduler.main_loop_sleep(scheduler, 10)
+    thread.join()
+    assert time() - start < 5
+    assert scheduler.message_queue.get_nowait() == 'foo'
+
+    # no wakeup
+    scheduler.main_loop_wakeup.clear()
+    start = time()
+    await Scheduler.main_loop_sleep(scheduler, 0.2)
+    assert time() - start >= 0.2
+
+
+def test_process_queued_task_messages():
+    """Messages are looked up by task ID and handled in order."""
+    scheduler = create_autospec(Scheduler)
+    scheduler.message_queue = SchedulerQueue(lambda: None)
+    foo = SimpleNamespace(identity='foo.1')
+    scheduler.pool = SimpleNamespace(
+        get_tasks=lambda: pytest.fail('should not scan the pool'),
+        get_pool_task_by_id={'foo.1': foo}.get
+    )
+    for task_job, message in [
+        ('1/foo/01', 'started'),
+        ('1/bar/01', 'started'),
+        ('1/foo/01', 'succeeded'),
+    ]:
+        scheduler.message_queue.put((task_job, 'now', 'INFO', message))
+    processed = []
+    scheduler.task_events_mgr.process_message = (
+        lambda itask, _, message, *__: processed.append(
+            (itask.identity, message)))
+
+    Scheduler.process_queued_task_messages(scheduler)
+    assert processed == [('foo.1', 'started'), ('foo.1', 'succeeded')]
+    scheduler.task_job_mgr.poll_task_jobs.assert_called_once_with(
+        scheduler.suite, [])
@@ -14,12 +14,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 from tempfile import NamedTemporaryFile, SpooledTemporaryFile, TemporaryFile,\
     TemporaryDirectory
+from time import sleep, time
 import unittest
 
 from pathlib import Path
 
+import pytest
+
 from cylc.flow.subprocctx import SubProcContext
 from cylc.flow.subprocpool import SubProcPool, _XTRIG_FUNCS, get_func
 
@@ -137,6 +141,24 @@ class TestSubProcPool(unittest.TestCase):
         for handle in handles:
             handle.close()
 
+    def test_process_large_output(self):
+        """Test output larger than the pipe buffer is captured intact."""
+        pool = SubProcPool()
+        ctxs = []
+        for _ in range(3):
+            ctx = SubProcContext(
+                'big', ['python3', '-c', 'print("喵" * 100000)'])
+            pool.put_command(ctx, lambda ctx: ctxs.append(ctx))
+        while pool.is_not_done():
+            pool.process()
+            sleep(0.01)
+        self.assertEqual(len(ctxs), 3)
+        for ctx in ctxs:
+            self.assertEqual(ctx.ret_code, 0)
+            self.assertEqual(ctx.out, '喵' * 100000 + '\n')
+        self.assertEqual(pool.pipe_buffers, {})
+        self.assertEqual(pool.open_filenos, set())
+
     def test_xfunction(self):
         """Test xtrigger function import."""
         with TemporaryDirectory() as temp_dir:
@@ -195,5 +217,54 @@ class TestSubProcPool(unittest.TestCase):
                 get_func("the_sword", temp_dir)
 
 
+@pytest.mark.asyncio
+async def test_process_wakeup():
+    """Test the wakeup callback is called when a command exits."""
+    woken = asyncio.Event()
+    pool = SubProcPool(woken.set)
+    ctx = SubProcContext('sleepy', ['sleep', '0.1'])
+    pool.put_command(ctx)
+    pool.process()
+    start = time()
+    while pool.is_not_done():
+        await asyncio.wait_for(woken.wait(), 5)
+        woken.clear()
+        pool.process()
+    assert time() - start < 5
+    assert ctx.ret_code == 0
+    assert pool.watched_filenos == set()
+    assert pool.exit_wakeup_pids == set()
+
+
+@pytest.mark.asyncio
+async def test_process_wakeup_chatty():
+    """Test the caller is not woken up for each chunk of output."""
+    wakeups = []
+    woken = asyncio.Event()
+
+    def wakeup():
+        wakeups.append(time())
+        woken.set()
+
+    pool = SubProcPool(wakeup)
+    ctx = SubProcContext('chatty', [
+        'python3', '-c',
+        'import time\n'
+        'for i in range(200):\n'
+        '    print(i, flush=True)\n'
+        '    time.sleep(0.002)'
+    ])
+    pool.put_command(ctx)
+    pool.process()
+    while pool.is_not_done():
+        await asyncio.wait_for(woken.wait(), 5)
+        woken.clear()
+        pool.process()
+    assert ctx.ret_code == 0
+    assert ctx.out == ''.join(f'{i}\n' for i in range(200))
+    # once for EOF on each pipe, and at most once more for the exit
+    assert len(wakeups) <= 3
+
+
 if __name__ == '__main__':
     unittest.main()
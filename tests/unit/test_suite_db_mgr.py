@@ -0,0 +1,194 @@
+# THIS FILE IS PART OF THE CYLC SUITE ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from types import SimpleNamespace
+
+import pytest
+
+from cylc.flow.cycling.loader import get_point
+from cylc.flow.suite_db_mgr import SuiteDatabaseManager
+
+
+def make_itask(name, point, status='waiting', prereqs=None):
+    """Return a minimal task proxy for SuiteDatabaseManager.put_task_pool."""
+    return SimpleNamespace(
+        tdef=SimpleNamespace(name=name),
+        point=point,
+        flow_label='a',
+        submit_num=0,
+        timeout=None,
+        poll_timer=None,
+        try_timers={},
+        get_try_num=lambda: 1,
+        state=SimpleNamespace(
+            status=status,
+            is_held=False,
+            time_updated=None,
+            prerequisites=[
+                SimpleNamespace(satisfied=dict(prereqs or {}))
+            ]
+        )
+    )
+
+
+def make_pool(itasks):
+    return SimpleNamespace(get_all_tasks=lambda: list(itasks))
+
+
+def n_queued(db_mgr, table_name):
+    """Return and clear the number of (deletes, inserts) queued for a table."""
+    ret = (
+        len(db_mgr.db_deletes_map[table_name]),
+        len(db_mgr.db_inserts_map[table_name])
+    )
+    db_mgr.db_deletes_map[table_name].clear()
+    db_mgr.db_inserts_map[table_name].clear()
+    return ret
+
+
+@pytest.fixture
+def db_mgr():
+    return SuiteDatabaseManager()
+
+
+def test_put_task_pool_first_call(db_mgr):
+    """The first call wipes the tables and inserts every row."""
+    itasks = [
+        make_itask(f't{ind}', 1, prereqs={(f'p{ind}', '1', 'succeeded'): 0})
+        for ind in range(10)
+    ]
+    db_mgr.put_task_pool(make_pool(itasks))
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_POOL) == (1, 10)
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_PREREQUISITES) == (1, 10)
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_TIMEOUT_TIMERS) == (1, 0)
+
+
+@pytest.mark.parametrize('pool_size', [10, 1000])
+def test_put_task_pool_incremental(db_mgr, pool_size):
+    """Subsequent calls only queue rows that have changed.
+
+    The number of queued statements must not depend on the pool size.
+    """
+    itasks = [
+        make_itask(f't{ind}', 1, prereqs={(f'p{ind}', '1', 'succeeded'): 0})
+        for ind in range(pool_size)
+    ]
+    pool = make_pool(itasks)
+    db_mgr.put_task_pool(pool)
+    for table_name in db_mgr.TASK_POOL_TABLE_KEYS:
+        n_queued(db_mgr, table_name)
+
+    # nothing changed
+    db_mgr.put_task_pool(pool)
+    for table_name in db_mgr.TASK_POOL_TABLE_KEYS:
+        assert n_queued(db_mgr, table_name) == (0, 0)
+
+    # one task changes state and has a prerequisite satisfied
+    itasks[0].state.status = 'running'
+    itasks[0].state.prerequisites[0].satisfied[('p0', '1', 'succeeded')] = (
+        'satisfied naturally')
+    db_mgr.put_task_pool(pool)
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_POOL) == (0, 1)
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_PREREQUISITES) == (0, 1)
+
+    # one task removed from the pool, one added
+    itasks.pop(1)
+    itasks.append(make_itask('new', 2))
+    db_mgr.put_task_pool(pool)
+    assert db_mgr.db_deletes_map[db_mgr.TABLE_TASK_POOL] == [
+        {'cycle': '1', 'name': 't1', 'flow_label': 'a'}]
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_POOL) == (1, 1)
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_PREREQUISITES) == (1, 0)
+
+
+def test_put_task_pool_action_timers(db_mgr):
+    """Task timers are re-inserted after the action timers table is wiped."""
+    itask = make_itask('foo', 1)
+    itask.poll_timer = SimpleNamespace(
+        ctx=None, delays=[1.0], num=0, delay=None, timeout=None)
+    pool = make_pool([itask])
+    db_mgr.put_task_pool(pool)
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_ACTION_TIMERS) == (0, 1)
+    db_mgr.put_task_pool(pool)
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_ACTION_TIMERS) == (0, 0)
+
+    db_mgr.put_task_event_timers(
+        SimpleNamespace(event_timers_updated=True, _event_timers={}))
+    db_mgr.put_task_pool(pool)
+    assert n_queued(db_mgr, db_mgr.TABLE_TASK_ACTION_TIMERS) == (1, 1)
+
+
+def test_get_submit_nums(db_mgr):
+    """Submit numbers are recorded in memory as task states are inserted."""
+    itask = make_itask('foo', 1)
+    assert db_mgr.get_submit_nums('foo', 1) == {}
+    db_mgr.put_insert_task_states(
+        itask, {"flow_label": "a", "submit_num": 0})
+    db_mgr.put_insert_task_states(
+        itask, {"flow_label": "b", "submit_num": 0})
+    assert db_mgr.get_submit_nums('foo', 1) == {'a': 0, 'b': 0}
+    assert db_mgr.get_submit_nums('bar', 1) == {}
+
+    # submit number updated via the task pool
+    itask.submit_num = 2
+    itask.state.time_updated = 'now'
+    db_mgr.put_task_pool(make_pool([itask]))
+    assert db_mgr.get_submit_nums('foo', 1) == {'a': 2, 'b': 0}
+
+
+def test_evict_submit_nums(db_mgr):
+    """Evicted cycle points are queried from the database."""
+    queries = []
+    db_mgr.pri_dao = SimpleNamespace(
+        select_submit_nums=lambda name, point: (
+            queries.append((name, point)) or {'a': 1}))
+    for point in (1, 2, 3):
+        db_mgr.put_insert_task_states(
+            make_itask('foo', point), {"flow_label": "a", "submit_num": 1})
+    db_mgr.evict_submit_nums(2)
+    assert list(db_mgr.submit_nums) == [2, 3]
+    assert db_mgr.get_submit_nums('foo', 2) == {'a': 1}
+    assert queries == []
+    assert db_mgr.get_submit_nums('foo', 1) == {'a': 1}
+    assert queries == [('foo', '1')]
+
+    # evicted points are not recorded again
+    db_mgr.put_insert_task_states(
+        make_itask('bar', 1), {"flow_label": "a", "submit_num": 1})
+    assert list(db_mgr.submit_nums) == [2, 3]
+
+    # the eviction point never moves backwards
+    db_mgr.evict_submit_nums(1)
+    assert db_mgr.submit_nums_min_point == 2
+
+
+def test_load_submit_nums_for_restart(db_mgr, cycling_mode):
+    """Only points from the earliest restart task pool point are loaded."""
+    cycling_mode(integer=True)
+    cycles = {'task_pool': {'3', '10'}, 'task_states': {'1', '2', '3', '10'}}
+    selected = []
+    db_mgr.pri_dao = SimpleNamespace(
+        select_cycles=lambda table_name: cycles[table_name],
+        select_submit_nums_for_restart=lambda callback, cycles=None: (
+            selected.append(sorted(cycles))
+            or callback(0, ['foo', '3', 'a', 1])),
+        select_submit_nums=lambda name, point: {'a': 5})
+    db_mgr.load_submit_nums_for_restart()
+    assert selected == [['10', '3']]
+    assert db_mgr.submit_nums_min_point == get_point('3')
+    assert db_mgr.get_submit_nums('foo', get_point('3')) == {'a': 1}
+    # earlier points are queried from the database
+    assert db_mgr.get_submit_nums('foo', get_point('1')) == {'a': 5}
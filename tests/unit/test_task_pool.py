@@ -0,0 +1,173 @@
+# THIS FILE IS PART OF THE CYLC SUITE ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from cylc.flow.cycling.integer import (
+    IntegerInterval, IntegerPoint, IntegerSequence)
+from cylc.flow.parsec.OrderedDict import OrderedDict
+from cylc.flow.task_pool import TaskPool
+from cylc.flow.task_state import (
+    TASK_STATUS_QUEUED,
+    TASK_STATUS_RUNNING,
+    TASK_STATUS_SUCCEEDED,
+    TASK_STATUS_WAITING,
+)
+
+
+class FakeTaskState:
+    def __init__(self, status):
+        self.status = status
+        self.is_held = False
+
+    def __call__(self, *statuses):
+        return self.status in statuses
+
+    def reset(self, status):
+        self.status = status
+
+
+def make_itask(name, status, ready=False, point=1):
+    itask = SimpleNamespace(
+        identity=f'{name}.{point}',
+        point=point,
+        tdef=SimpleNamespace(name=name, clocktrigger_offset=None),
+        state=FakeTaskState(status),
+        manual_trigger=False,
+        try_timers={},
+        is_ready=Mock(return_value=(ready,)),
+        reset_manual_trigger=Mock(),
+        is_task_prereqs_not_done=lambda: False,
+    )
+    return itask
+
+
+def make_pool(itasks, limit=0):
+    """Return a task pool with all of itasks in the default queue."""
+    pool = TaskPool.__new__(TaskPool)
+    pool.config = SimpleNamespace(
+        cfg={'scheduling': {'queues': {'default': {'limit': limit}}}})
+    pool.data_store_mgr = Mock()
+    pool.queues = {'default': OrderedDict(
+        (itask.identity, itask) for itask in itasks)}
+    return pool
+
+
+def test_get_ready_tasks():
+    """Ready tasks are queued and released in order."""
+    itasks = [
+        make_itask('a', TASK_STATUS_WAITING, ready=True),
+        make_itask('b', TASK_STATUS_QUEUED),
+        make_itask('c', TASK_STATUS_WAITING),
+        make_itask('d', TASK_STATUS_SUCCEEDED),
+    ]
+    pool = make_pool(itasks)
+    assert pool.get_ready_tasks() == [itasks[1], itasks[0]]
+    assert list(pool.queues['default']) == ['b.1', 'c.1', 'd.1', 'a.1']
+    assert itasks[0].state.status == TASK_STATUS_QUEUED
+    # only waiting tasks are checked
+    assert [itask.is_ready.call_count for itask in itasks] == [1, 0, 1, 0]
+
+
+@pytest.mark.parametrize(
+    'n_running, n_released',
+    [(0, 2), (1, 1), (2, 0), (3, 0)]
+)
+def test_get_ready_tasks_limit(n_running, n_released):
+    """Queued tasks are released up to the queue limit."""
+    itasks = [
+        make_itask(f'run{ind}', TASK_STATUS_RUNNING)
+        for ind in range(n_running)
+    ]
+    queued = [make_itask(f'q{ind}', TASK_STATUS_QUEUED) for ind in range(3)]
+    pool = make_pool(itasks + queued, limit=2)
+    assert pool.get_ready_tasks() == queued[:n_released]
+
+
+def test_release_runahead_tasks():
+    """The runahead limit counts from the first unfinished cycle point."""
+    pool = TaskPool.__new__(TaskPool)
+    pool.config = SimpleNamespace(sequences=[
+        IntegerSequence('R/1/P1', '1', '10')])
+    pool.custom_runahead_limit = IntegerInterval('P2')
+    pool.max_future_offset = None
+    pool.stop_point = None
+    pool._prev_runahead_base_point = None
+    pool.suite_db_mgr = Mock()
+    pool.pool = {}
+    pool.runahead_pool = {}
+
+    def release_runahead_task(itask):
+        del pool.runahead_pool[itask.point][itask.identity]
+        if not pool.runahead_pool[itask.point]:
+            del pool.runahead_pool[itask.point]
+        pool.pool.setdefault(itask.point, {})[itask.identity] = itask
+
+    pool.release_runahead_task = release_runahead_task
+    for ind in range(1, 6):
+        point = IntegerPoint(str(ind))
+        status = TASK_STATUS_SUCCEEDED if ind < 3 else TASK_STATUS_WAITING
+        itask = make_itask('foo', status, point=point)
+        pool.runahead_pool.setdefault(point, {})[itask.identity] = itask
+
+    assert pool.release_runahead_tasks()
+    assert sorted(pool.pool) == [
+        IntegerPoint(str(ind)) for ind in (1, 2, 3, 4)]
+    assert sorted(pool.runahead_pool) == [IntegerPoint('5')]
+    pool.suite_db_mgr.evict_submit_nums.assert_called_with(IntegerPoint('3'))
+
+    # nothing more to release until point 3 finishes
+    assert not pool.release_runahead_tasks()
+    pool.pool[IntegerPoint('3')]['foo.3'].state.status = TASK_STATUS_SUCCEEDED
+    assert pool.release_runahead_tasks()
+    assert not pool.runahead_pool
+
+
+def test_spawn_on_output_abs():
+    """Absolute outputs are recorded once and satisfy every child instance."""
+    pool = TaskPool.__new__(TaskPool)
+    pool.expected_failed_tasks = None
+    pool.suite_db_mgr = Mock()
+    pool.data_store_mgr = Mock()
+    pool.abs_outputs_done = set()
+    children = {}
+    for name in ('bar', 'baz'):
+        for point in (1, 2):
+            itask = make_itask(name, TASK_STATUS_WAITING, point=point)
+            itask.state.suicide_prerequisites = []
+            itask.state.satisfy_me = Mock()
+            children[itask.identity] = itask
+    pool.get_all_tasks = lambda: list(children.values())
+    pool.get_or_spawn_task = lambda name, point, **_: children[
+        f'{name}.{point}']
+
+    itask = make_itask('foo', TASK_STATUS_RUNNING)
+    itask.reflow = True
+    itask.flow_label = 'a'
+    itask.graph_children = {
+        'x': [('bar', 1, True), ('baz', 1, True), ('bar', 2, False)]
+    }
+    pool.spawn_on_output(itask, 'x')
+
+    assert pool.abs_outputs_done == {('foo', '1', 'x')}
+    pool.suite_db_mgr.put_insert_abs_output.assert_called_once_with(
+        '1', 'foo', 'x')
+    pool.suite_db_mgr.process_queued_ops.assert_not_called()
+    for child in children.values():
+        child.state.satisfy_me.assert_called_once_with({('foo', '1', 'x')})